@@ -54,7 +54,7 @@ def resolve_alpaca_option_contract(
     
     try:
         exp_date = datetime.strptime(expiration, "%Y-%m-%d").date()
-        exp_str = exp_date.strftime("%Y-%m-%d")
+        exp_str = exp_date.isoformat()
     except ValueError:
         return None, f"Invalid expiration format: {expiration}"
     
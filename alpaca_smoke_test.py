@@ -349,12 +349,13 @@ def _run_fill_test(base_url: str, headers: dict, steps: List[dict], order_ids: L
         steps.append(_make_step("Submit Market Buy", False, 0, f"Request error: {e}"))
         return
     
-    start_time = time.time()
+    # Monotonic, so a wall-clock adjustment can't stretch or cut the wait
+    deadline = time.monotonic() + FILL_TIMEOUT
     filled = False
     filled_qty = 0
     filled_price = None
     
-    while time.time() - start_time < FILL_TIMEOUT:
+    while time.monotonic() < deadline:
         time.sleep(POLL_INTERVAL)
         try:
             resp = requests.get(f"{base_url}/v2/orders/{order_id}", headers=headers, timeout=TIMEOUT)
@@ -91,7 +91,7 @@ def _build_option_symbol(
     """
     date_str = expiration.strftime("%y%m%d")
     type_char = "C" if option_type == "CALL" else "P"
-    strike_int = int(strike * 1000)
+    strike_int = round(strike * 1000)  # int() would truncate 2.3 * 1000 to 2299
     strike_str = f"{strike_int:08d}"
     
     return f"{underlying}{date_str}{type_char}{strike_str}"
@@ -10,12 +10,14 @@ If pre-existing positions exist, SELL is skipped to avoid liquidating them.
 import os
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 
 import requests
 
 from env_loader import load_env, get_checked_sources
+from smoke_http import get_session, decode_json
 
 logger = logging.getLogger(__name__)
 
@@ -33,24 +35,24 @@ def _make_step(name: str, ok: bool, status: int = 0, summary: str = "", details:
     }
 
 
-def _get_alpaca_position_qty(base_url: str, headers: dict, symbol: str) -> int:
+def _get_alpaca_position_qty(http: requests.Session, base_url: str, symbol: str) -> int:
     """Get current position quantity for a symbol. Returns 0 if no position."""
     try:
-        resp = requests.get(f"{base_url}/v2/positions/{symbol}", headers=headers, timeout=TIMEOUT)
+        resp = http.get(f"{base_url}/v2/positions/{symbol}", timeout=TIMEOUT)
         if resp.status_code == 200:
-            data = resp.json()
+            data = decode_json(resp)
             return int(float(data.get("qty", 0)))
         return 0
     except:
         return 0
 
 
-def _get_tradier_position_qty(base_url: str, headers: dict, account_id: str, symbol: str) -> int:
+def _get_tradier_position_qty(http: requests.Session, base_url: str, account_id: str, symbol: str) -> int:
     """Get current position quantity for a symbol. Returns 0 if no position."""
     try:
-        resp = requests.get(f"{base_url}/v1/accounts/{account_id}/positions", headers=headers, timeout=TIMEOUT)
+        resp = http.get(f"{base_url}/v1/accounts/{account_id}/positions", timeout=TIMEOUT)
         if resp.status_code == 200:
-            data = resp.json()
+            data = decode_json(resp)
             positions = data.get("positions", {})
             if not positions or positions == "null" or not isinstance(positions, dict):
                 return 0
@@ -114,15 +116,15 @@ def alpaca_smoke_test() -> dict:
             "steps": steps
         }
     
-    headers = {
+    http = get_session("alpaca", {
         "APCA-API-KEY-ID": api_key,
         "APCA-API-SECRET-KEY": api_secret
-    }
+    })
     
     try:
-        resp = requests.get(f"{base_url}/v2/account", headers=headers, timeout=TIMEOUT)
+        resp = http.get(f"{base_url}/v2/account", timeout=TIMEOUT)
         if resp.status_code == 200:
-            data = resp.json()
+            data = decode_json(resp)
             equity = data.get("equity", "N/A")
             steps.append(_make_step("Get Account", True, 200, f"Equity: ${equity}"))
         else:
@@ -133,9 +135,9 @@ def alpaca_smoke_test() -> dict:
         steps.append(_make_step("Get Account", False, 0, f"Request error: {e}"))
     
     try:
-        resp = requests.get(f"{base_url}/v2/clock", headers=headers, timeout=TIMEOUT)
+        resp = http.get(f"{base_url}/v2/clock", timeout=TIMEOUT)
         if resp.status_code == 200:
-            data = resp.json()
+            data = decode_json(resp)
             market_open = data.get("is_open", False)
             status_text = "Market OPEN" if market_open else "Market CLOSED"
             steps.append(_make_step("Get Clock", True, 200, status_text))
@@ -147,9 +149,9 @@ def alpaca_smoke_test() -> dict:
         steps.append(_make_step("Get Clock", False, 0, f"Request error: {e}"))
     
     try:
-        resp = requests.get(f"{base_url}/v2/assets/AAPL", headers=headers, timeout=TIMEOUT)
+        resp = http.get(f"{base_url}/v2/assets/AAPL", timeout=TIMEOUT)
         if resp.status_code == 200:
-            data = resp.json()
+            data = decode_json(resp)
             tradable = data.get("tradable", False)
             steps.append(_make_step("Get Asset AAPL", True, 200, f"Tradable: {tradable}"))
         else:
@@ -159,7 +161,7 @@ def alpaca_smoke_test() -> dict:
     except requests.exceptions.RequestException as e:
         steps.append(_make_step("Get Asset AAPL", False, 0, f"Request error: {e}"))
     
-    baseline_qty = _get_alpaca_position_qty(base_url, headers, "AAPL")
+    baseline_qty = _get_alpaca_position_qty(http, base_url, "AAPL")
     
     buy_accepted = False
     try:
@@ -170,9 +172,9 @@ def alpaca_smoke_test() -> dict:
             "type": "market",
             "time_in_force": "day"
         }
-        resp = requests.post(f"{base_url}/v2/orders", headers=headers, json=order_data, timeout=TIMEOUT)
+        resp = http.post(f"{base_url}/v2/orders", json=order_data, timeout=TIMEOUT)
         if resp.status_code in (200, 201):
-            data = resp.json()
+            data = decode_json(resp)
             buy_order_id = data.get("id", "")
             status = data.get("status", "unknown")
             steps.append(_make_step(f"BUY {test_qty} AAPL", True, resp.status_code, f"Order {buy_order_id[:8]}... status: {status}"))
@@ -194,9 +196,9 @@ def alpaca_smoke_test() -> dict:
         for attempt in range(max_retries):
             time.sleep(retry_delay)
             try:
-                resp = requests.get(f"{base_url}/v2/orders/{buy_order_id}", headers=headers, timeout=TIMEOUT)
+                resp = http.get(f"{base_url}/v2/orders/{buy_order_id}", timeout=TIMEOUT)
                 if resp.status_code == 200:
-                    data = resp.json()
+                    data = decode_json(resp)
                     final_status = data.get("status", "unknown")
                     filled_qty = int(float(data.get("filled_qty", 0) or 0))
                     filled_price = data.get("filled_avg_price")
@@ -221,7 +223,7 @@ def alpaca_smoke_test() -> dict:
     
     if buy_accepted:
         try:
-            current_qty = _get_alpaca_position_qty(base_url, headers, "AAPL")
+            current_qty = _get_alpaca_position_qty(http, base_url, "AAPL")
             position_delta = current_qty - baseline_qty
             
             if position_delta >= test_qty:
@@ -249,9 +251,9 @@ def alpaca_smoke_test() -> dict:
                 "type": "market",
                 "time_in_force": "day"
             }
-            resp = requests.post(f"{base_url}/v2/orders", headers=headers, json=order_data, timeout=TIMEOUT)
+            resp = http.post(f"{base_url}/v2/orders", json=order_data, timeout=TIMEOUT)
             if resp.status_code in (200, 201):
-                data = resp.json()
+                data = decode_json(resp)
                 sell_order_id = data.get("id", "")
                 status = data.get("status", "unknown")
                 steps.append(_make_step(f"SELL {sell_qty} AAPL", True, resp.status_code, f"Order {sell_order_id[:8]}... status: {status}"))
@@ -268,13 +270,13 @@ def alpaca_smoke_test() -> dict:
     if sell_accepted and sell_order_id:
         time.sleep(3)
         try:
-            resp = requests.get(f"{base_url}/v2/orders/{sell_order_id}", headers=headers, timeout=TIMEOUT)
+            resp = http.get(f"{base_url}/v2/orders/{sell_order_id}", timeout=TIMEOUT)
             sell_status = "unknown"
             if resp.status_code == 200:
-                data = resp.json()
+                data = decode_json(resp)
                 sell_status = data.get("status", "unknown")
             
-            current_qty = _get_alpaca_position_qty(base_url, headers, "AAPL")
+            current_qty = _get_alpaca_position_qty(http, base_url, "AAPL")
             if current_qty == baseline_qty:
                 steps.append(_make_step("Confirm Position Closed", True, 200, f"Position returned to baseline ({baseline_qty})"))
             elif current_qty < baseline_qty + position_delta:
@@ -287,9 +289,9 @@ def alpaca_smoke_test() -> dict:
         steps.append(_make_step("Confirm Position Closed", True, 0, "SKIPPED_PAPER: No SELL attempted"))
     
     try:
-        resp = requests.get(f"{base_url}/v2/orders?status=all&limit=5", headers=headers, timeout=TIMEOUT)
+        resp = http.get(f"{base_url}/v2/orders?status=all&limit=5", timeout=TIMEOUT)
         if resp.status_code == 200:
-            data = resp.json()
+            data = decode_json(resp)
             count = len(data)
             steps.append(_make_step("List Orders", True, 200, f"Found {count} recent orders"))
         else:
@@ -338,70 +340,16 @@ TRADIER_REQUIRED_STEPS = {
 TRADIER_BUY_STEP_PREFIX = "BUY"
 
 
-def tradier_smoke_test() -> dict:
-    """
-    Run smoke test for Tradier API.
-    
-    Tests:
-    A) Get account info (discover account_id) - REQUIRED
-    B) Get SPY quote - REQUIRED
-    C) Get option expirations (SPX, fallback to SPY) - REQUIRED
-    D) Get option chain (nearest expiration) - REQUIRED
-    E) BUY 1 share SPY (if available) - REQUIRED (order acceptance)
-    F) Confirm position - OPTIONAL (sandbox limitation)
-    G) SELL 1 share SPY - OPTIONAL (sandbox limitation)
-    H) Confirm position closed - OPTIONAL (sandbox limitation)
-    
-    SAFETY: Captures baseline position before BUY.
-    Only sells 1 share (the test share), not pre-existing holdings.
-    
-    Sandbox mode: Tradier sandbox accepts orders but often does NOT reflect
-    positions immediately. Position-related steps are marked SKIPPED_SANDBOX
-    and do not affect the overall success result.
-    
-    Returns:
-        dict with broker, success, timestamp, and steps
-    """
-    token = load_env("TRADIER_TOKEN") or ""
-    base_url = load_env("TRADIER_BASE_URL") or "https://sandbox.tradier.com"
-    account_id = load_env("TRADIER_ACCOUNT_ID") or ""
-    
-    # Detect sandbox mode
-    is_sandbox = "sandbox" in base_url.lower()
-    
+def _tradier_account_steps(http: requests.Session, base_url: str, account_id: str) -> tuple:
+    """Tradier step A: discover the account; returns (steps, account_id, can_trade)."""
     steps = []
     can_trade = False
-    can_sell = False
-    baseline_qty = 0
-    test_qty = 1
-    trade_symbol = "SPY"
-    
-    checked = ", ".join(get_checked_sources())
-    if not token:
-        steps.append(_make_step(
-            "Auth Check",
-            False,
-            0,
-            "Missing TRADIER_TOKEN",
-            f"Checked: {checked}. Use /debug/env to inspect."
-        ))
-        return {
-            "broker": "tradier",
-            "success": False,
-            "timestamp": datetime.utcnow().isoformat(),
-            "steps": steps
-        }
-    
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/json"
-    }
     
     if not account_id:
         try:
-            resp = requests.get(f"{base_url}/v1/user/profile", headers=headers, timeout=TIMEOUT)
+            resp = http.get(f"{base_url}/v1/user/profile", timeout=TIMEOUT)
             if resp.status_code == 200:
-                data = resp.json()
+                data = decode_json(resp)
                 profile = data.get("profile", {})
                 account_data = profile.get("account", [])
                 if isinstance(account_data, dict):
@@ -423,11 +371,17 @@ def tradier_smoke_test() -> dict:
     else:
         steps.append(_make_step("Get Account", True, 0, f"Using provided account: {account_id[:4]}..."))
         can_trade = True
+    return steps, account_id, can_trade
+
+
+def _tradier_quote_steps(http: requests.Session, base_url: str) -> list:
+    """Tradier step B: quote SPY; returns steps."""
+    steps = []
     
     try:
-        resp = requests.get(f"{base_url}/v1/markets/quotes", headers=headers, params={"symbols": "SPY"}, timeout=TIMEOUT)
+        resp = http.get(f"{base_url}/v1/markets/quotes", params={"symbols": "SPY"}, timeout=TIMEOUT)
         if resp.status_code == 200:
-            data = resp.json()
+            data = decode_json(resp)
             quotes = data.get("quotes", {})
             quote = quotes.get("quote", {})
             if isinstance(quote, list):
@@ -440,14 +394,19 @@ def tradier_smoke_test() -> dict:
         steps.append(_make_step("Quote SPY", False, 0, "Request timed out"))
     except requests.exceptions.RequestException as e:
         steps.append(_make_step("Quote SPY", False, 0, f"Request error: {e}"))
-    
+    return steps
+
+
+def _tradier_expiration_steps(http: requests.Session, base_url: str) -> tuple:
+    """Tradier step C: SPX expirations, falling back to SPY; returns (steps, dates, symbol)."""
+    steps = []
     expirations = []
     exp_symbol = "SPX"
     
     try:
-        resp = requests.get(f"{base_url}/v1/markets/options/expirations", headers=headers, params={"symbol": "SPX"}, timeout=TIMEOUT)
+        resp = http.get(f"{base_url}/v1/markets/options/expirations", params={"symbol": "SPX"}, timeout=TIMEOUT)
         if resp.status_code == 200:
-            data = resp.json()
+            data = decode_json(resp)
             exp_data = data.get("expirations", {})
             date_list = exp_data.get("date", [])
             if isinstance(date_list, str):
@@ -459,9 +418,9 @@ def tradier_smoke_test() -> dict:
                 steps.append(_make_step("Option Expirations SPX", True, 200, f"Found {len(expirations)} expirations"))
             else:
                 exp_symbol = "SPY"
-                resp2 = requests.get(f"{base_url}/v1/markets/options/expirations", headers=headers, params={"symbol": "SPY"}, timeout=TIMEOUT)
+                resp2 = http.get(f"{base_url}/v1/markets/options/expirations", params={"symbol": "SPY"}, timeout=TIMEOUT)
                 if resp2.status_code == 200:
-                    data2 = resp2.json()
+                    data2 = decode_json(resp2)
                     exp_data2 = data2.get("expirations", {})
                     date_list2 = exp_data2.get("date", [])
                     if isinstance(date_list2, str):
@@ -473,9 +432,9 @@ def tradier_smoke_test() -> dict:
                     steps.append(_make_step("Option Expirations", False, resp2.status_code, "Failed to fetch SPY expirations", resp2.text))
         else:
             exp_symbol = "SPY"
-            resp2 = requests.get(f"{base_url}/v1/markets/options/expirations", headers=headers, params={"symbol": "SPY"}, timeout=TIMEOUT)
+            resp2 = http.get(f"{base_url}/v1/markets/options/expirations", params={"symbol": "SPY"}, timeout=TIMEOUT)
             if resp2.status_code == 200:
-                data2 = resp2.json()
+                data2 = decode_json(resp2)
                 exp_data2 = data2.get("expirations", {})
                 date_list2 = exp_data2.get("date", [])
                 if isinstance(date_list2, str):
@@ -489,18 +448,94 @@ def tradier_smoke_test() -> dict:
         steps.append(_make_step("Option Expirations", False, 0, "Request timed out"))
     except requests.exceptions.RequestException as e:
         steps.append(_make_step("Option Expirations", False, 0, f"Request error: {e}"))
+    return steps, expirations, exp_symbol
+
+
+def tradier_smoke_test() -> dict:
+    """
+    Run smoke test for Tradier API.
+    
+    Tests:
+    A) Get account info (discover account_id) - REQUIRED
+    B) Get SPY quote - REQUIRED
+    C) Get option expirations (SPX, fallback to SPY) - REQUIRED
+    D) Get option chain (nearest expiration) - REQUIRED
+    E) BUY 1 share SPY (if available) - REQUIRED (order acceptance)
+    F) Confirm position - OPTIONAL (sandbox limitation)
+    G) SELL 1 share SPY - OPTIONAL (sandbox limitation)
+    H) Confirm position closed - OPTIONAL (sandbox limitation)
+    
+    SAFETY: Captures baseline position before BUY.
+    Only sells 1 share (the test share), not pre-existing holdings.
+    
+    Sandbox mode: Tradier sandbox accepts orders but often does NOT reflect
+    positions immediately. Position-related steps are marked SKIPPED_SANDBOX
+    and do not affect the overall success result.
+    
+    Returns:
+        dict with broker, success, timestamp, and steps
+    """
+    token = load_env("TRADIER_TOKEN") or ""
+    base_url = load_env("TRADIER_BASE_URL") or "https://sandbox.tradier.com"
+    account_id = load_env("TRADIER_ACCOUNT_ID") or ""
+    
+    # Detect sandbox mode
+    is_sandbox = "sandbox" in base_url.lower()
+    
+    steps = []
+    can_trade = False
+    can_sell = False
+    baseline_qty = 0
+    test_qty = 1
+    trade_symbol = "SPY"
+    
+    checked = ", ".join(get_checked_sources())
+    if not token:
+        steps.append(_make_step(
+            "Auth Check",
+            False,
+            0,
+            "Missing TRADIER_TOKEN",
+            f"Checked: {checked}. Use /debug/env to inspect."
+        ))
+        return {
+            "broker": "tradier",
+            "success": False,
+            "timestamp": datetime.utcnow().isoformat(),
+            "steps": steps
+        }
+    
+    http = get_session("tradier", {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/json"
+    })
+    
+    # Steps A-C don't depend on each other, so their round trips overlap.
+    # Steps are still recorded in the original order; the chain needs an
+    # expiration and runs after them.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        account_future = pool.submit(_tradier_account_steps, http, base_url, account_id)
+        quote_future = pool.submit(_tradier_quote_steps, http, base_url)
+        expirations_future = pool.submit(_tradier_expiration_steps, http, base_url)
+        
+        account_steps, account_id, can_trade = account_future.result()
+        quote_steps = quote_future.result()
+        expiration_steps, expirations, exp_symbol = expirations_future.result()
+    
+    steps.extend(account_steps)
+    steps.extend(quote_steps)
+    steps.extend(expiration_steps)
     
     if expirations:
         nearest_exp = expirations[0]
         try:
-            resp = requests.get(
+            resp = http.get(
                 f"{base_url}/v1/markets/options/chains",
-                headers=headers,
                 params={"symbol": exp_symbol, "expiration": nearest_exp},
                 timeout=TIMEOUT
             )
             if resp.status_code == 200:
-                data = resp.json()
+                data = decode_json(resp)
                 options = data.get("options", {})
                 option_list = options.get("option", [])
                 if isinstance(option_list, dict):
@@ -517,7 +552,7 @@ def tradier_smoke_test() -> dict:
         steps.append(_make_step("Option Chain", False, 0, "Skipped: no expirations available"))
     
     if can_trade and account_id:
-        baseline_qty = _get_tradier_position_qty(base_url, headers, account_id, trade_symbol)
+        baseline_qty = _get_tradier_position_qty(http, base_url, account_id, trade_symbol)
     
     buy_success = False
     if can_trade and account_id:
@@ -530,14 +565,13 @@ def tradier_smoke_test() -> dict:
                 "type": "market",
                 "duration": "day"
             }
-            resp = requests.post(
+            resp = http.post(
                 f"{base_url}/v1/accounts/{account_id}/orders",
-                headers=headers,
                 data=order_data,
                 timeout=TIMEOUT
             )
             if resp.status_code in (200, 201):
-                data = resp.json()
+                data = decode_json(resp)
                 order_info = data.get("order", {})
                 order_id = order_info.get("id", "N/A")
                 status = order_info.get("status", "submitted")
@@ -562,9 +596,9 @@ def tradier_smoke_test() -> dict:
     if buy_success:
         time.sleep(2)
         try:
-            resp = requests.get(f"{base_url}/v1/accounts/{account_id}/positions", headers=headers, timeout=TIMEOUT)
+            resp = http.get(f"{base_url}/v1/accounts/{account_id}/positions", timeout=TIMEOUT)
             if resp.status_code == 200:
-                data = resp.json()
+                data = decode_json(resp)
                 positions = data.get("positions", {})
                 if not positions or positions == "null" or not isinstance(positions, dict):
                     position_list = []
@@ -627,14 +661,13 @@ def tradier_smoke_test() -> dict:
                 "type": "market",
                 "duration": "day"
             }
-            resp = requests.post(
+            resp = http.post(
                 f"{base_url}/v1/accounts/{account_id}/orders",
-                headers=headers,
                 data=order_data,
                 timeout=TIMEOUT
             )
             if resp.status_code in (200, 201):
-                data = resp.json()
+                data = decode_json(resp)
                 order_info = data.get("order", {})
                 order_id = order_info.get("id", "N/A")
                 status = order_info.get("status", "submitted")
@@ -659,9 +692,9 @@ def tradier_smoke_test() -> dict:
     if sell_success:
         time.sleep(2)
         try:
-            resp = requests.get(f"{base_url}/v1/accounts/{account_id}/positions", headers=headers, timeout=TIMEOUT)
+            resp = http.get(f"{base_url}/v1/accounts/{account_id}/positions", timeout=TIMEOUT)
             if resp.status_code == 200:
-                data = resp.json()
+                data = decode_json(resp)
                 positions = data.get("positions", {})
                 if not positions or positions == "null" or not isinstance(positions, dict):
                     position_list = []
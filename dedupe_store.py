@@ -181,7 +181,7 @@ def get_executed_count_today() -> int:
     Returns:
         Number of signals executed today
     """
-    today_str = datetime.utcnow().strftime("%Y-%m-%d")
+    today_str = datetime.utcnow().date().isoformat()
     count = 0
     
     for entry in get_all_executed():
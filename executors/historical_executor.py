@@ -50,7 +50,7 @@ class HistoricalExecutor(BaseExecutor):
         """
         is_valid, error = self.validate_intent(intent)
         if not is_valid:
-            return ExecutionResult(
+            return ExecutionResult.internal(
                 intent_id=intent.id,
                 status="REJECTED",
                 broker=self.broker_name,
@@ -60,7 +60,8 @@ class HistoricalExecutor(BaseExecutor):
         self._order_counter += 1
         order_id = f"HIST-{self._order_counter:06d}"
         
-        fill_price = self._get_historical_price(intent)
+        # Prices set by callers may be ints; internal() doesn't coerce them
+        fill_price = float(self._get_historical_price(intent))
         
         logger.info(f"[HISTORICAL] Mock fill for {intent.underlying}: "
                     f"{intent.action} {intent.quantity} @ ${fill_price:.2f}")
@@ -74,7 +75,7 @@ class HistoricalExecutor(BaseExecutor):
             "historical_mode": True
         }
         
-        return ExecutionResult(
+        return ExecutionResult.internal(
             intent_id=intent.id,
             status="SIMULATED",
             broker=self.broker_name,
@@ -61,7 +61,7 @@ class PaperExecutor(BaseExecutor):
         """
         is_valid, error = self.validate_intent(intent)
         if not is_valid:
-            return ExecutionResult(
+            return ExecutionResult.internal(
                 intent_id=intent.id,
                 status="REJECTED",
                 broker=self.broker_name,
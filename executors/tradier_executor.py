@@ -65,7 +65,7 @@ class TradierExecutor(BaseExecutor):
         """
         is_valid, error = self.validate_intent(intent)
         if not is_valid:
-            return ExecutionResult(
+            return ExecutionResult.internal(
                 intent_id=intent.id,
                 status="REJECTED",
                 broker=self.broker_name,
@@ -78,21 +78,21 @@ class TradierExecutor(BaseExecutor):
             elif intent.instrument_type == "OPTION":
                 return self._execute_option_order(intent)
             elif intent.instrument_type == "SPREAD":
-                return ExecutionResult(
+                return ExecutionResult.internal(
                     intent_id=intent.id,
                     status="SKIPPED",
                     broker=self.broker_name,
                     message="SPREAD_SUBMIT_NOT_IMPLEMENTED - Multi-leg spread submission not yet supported"
                 )
             elif intent.instrument_type == "OPTION_SPREAD":
-                return ExecutionResult(
+                return ExecutionResult.internal(
                     intent_id=intent.id,
                     status="SKIPPED",
                     broker=self.broker_name,
                     message="SPREAD_SUBMIT_NOT_IMPLEMENTED - Multi-leg spread submission not yet supported"
                 )
             else:
-                return ExecutionResult(
+                return ExecutionResult.internal(
                     intent_id=intent.id,
                     status="REJECTED",
                     broker=self.broker_name,
@@ -100,7 +100,7 @@ class TradierExecutor(BaseExecutor):
                 )
         except TradierError as e:
             logger.error(f"Tradier execution error for intent {intent.id}: {e}")
-            return ExecutionResult(
+            return ExecutionResult.internal(
                 intent_id=intent.id,
                 status="ERROR",
                 broker=self.broker_name,
@@ -109,7 +109,7 @@ class TradierExecutor(BaseExecutor):
             )
         except Exception as e:
             logger.exception(f"Unexpected error executing trade {intent.id}: {e}")
-            return ExecutionResult(
+            return ExecutionResult.internal(
                 intent_id=intent.id,
                 status="ERROR",
                 broker=self.broker_name,
@@ -171,7 +171,7 @@ class TradierExecutor(BaseExecutor):
     def _execute_option_order(self, intent: TradeIntent) -> ExecutionResult:
         """Execute a single-leg option order."""
         if not intent.legs:
-            return ExecutionResult(
+            return ExecutionResult.internal(
                 intent_id=intent.id,
                 status="REJECTED",
                 broker=self.broker_name,
@@ -179,7 +179,7 @@ class TradierExecutor(BaseExecutor):
             )
         
         if intent.order_type in ("STOP", "STOP_LIMIT"):
-            return ExecutionResult(
+            return ExecutionResult.internal(
                 intent_id=intent.id,
                 status="REJECTED",
                 broker=self.broker_name,
@@ -13,6 +13,19 @@ from typing import Optional, Dict, Any, List
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional; it encodes records several times faster than json.
+# Datetimes and dataclasses are passed to default=str, as json.dumps does.
+try:
+    import orjson
+    _ORJSON_OPTIONS = (
+        orjson.OPT_APPEND_NEWLINE
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+except ImportError:
+    orjson = None
+
 LOGS_DIR = Path("logs")
 RAW_ALERTS_FILE = LOGS_DIR / "alerts_raw.jsonl"
 PARSED_ALERTS_FILE = LOGS_DIR / "alerts_parsed.jsonl"
@@ -29,6 +42,17 @@ def _generate_post_id(content: str) -> str:
     return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
 
 
+def _encode_line(data: Dict[str, Any]) -> bytes:
+    """Encode a record as one UTF-8 JSON line."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # e.g. integers beyond 64 bits; json.dumps handles these
+            pass
+    return (json.dumps(data, default=str) + "\n").encode('utf-8')
+
+
 def _atomic_append(filepath: Path, data: Dict[str, Any]) -> bool:
     """
     Atomically append a JSON line to a file.
@@ -36,8 +60,8 @@ def _atomic_append(filepath: Path, data: Dict[str, Any]) -> bool:
     """
     try:
         _ensure_logs_dir()
-        line = json.dumps(data, default=str) + "\n"
-        with open(filepath, 'a', encoding='utf-8') as f:
+        line = _encode_line(data)
+        with open(filepath, 'ab') as f:
             f.write(line)
         return True
     except Exception as e:
@@ -12,6 +12,7 @@ Classification Rules:
 
 import re
 import hashlib
+from functools import lru_cache
 from datetime import date, datetime
 from typing import Optional, Literal, cast
 from dateutil import parser as date_parser
@@ -20,6 +21,109 @@ from models import ParsedSignal, OptionLeg
 import config
 
 
+# Patterns are compiled once at import; the extractors below run per alert.
+# Patterns applied to lower-cased text are compiled without IGNORECASE.
+
+# Non-signal phrases as alternatives of one pattern, so all phrases are tried in a single scan
+_NON_SIGNAL_RE = re.compile('|'.join(f'(?:{p})' for p in (
+    r'\bwill be assigned\b',
+    r'\bgot assigned\b',
+    r'\bwas assigned\b',
+    r'\bassignment\b',
+    r'\bwatch out\b',
+    r'\bmarket is doing\b',
+    r'\bmarket update\b',
+    r'\bI\'m cool with\b',
+    r'\bmax profit\b.*\bclosed\b',
+    r'\bhit max profit\b',
+)))
+
+_LOOKS_LONG_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'\blong\s+[A-Z]{1,5}\b',
+    r'\bbuy(?:ing)?\s+\d+\s*shares?\s+(?:of\s+)?[A-Z]{1,5}\b',
+    r'\bbuy(?:ing)?\s+[A-Z]{1,5}\s+(?:calls?|puts?)\b',
+    r'\bgoing\s+long\b',
+)]
+
+_TRADE_LEG_RE = re.compile(r'[+-]\d+\s+\d+\s*[CP]', re.IGNORECASE)
+
+_EXIT_PATTERNS = [re.compile(p) for p in (
+    r'\bexit\b',
+    r'\btake profits?\b',
+    r'\bcut\s+(the\s+)?position\b',
+    r'\bclose\s+(the\s+)?position\b',
+    r'\bclose\s+(it|this)\b',
+    r'\bclosing\b.*\bposition\b',
+    r'\bselling?\s+to\s+close\b',
+    r'\bbuy\s+to\s+close\b',
+)]
+
+_LONG_POSITION_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'\blong\s+[A-Z]{1,5}\b',
+    r'\bbuy(?:ing)?\s+\d+\s*shares?\s+(?:of\s+)?[A-Z]{1,5}\b',
+    r'\bbuy(?:ing)?\s+[A-Z]{1,5}\s+(?:calls?|puts?)\b',
+    r'\bgoing\s+long\s+(?:on\s+)?[A-Z]{1,5}\b',
+    r'\blong\s+[A-Z]{1,5}\s+\d+\s*[CP]\b',
+)]
+
+_LONG_TICKER_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'\bgoing\s+long\s+(?:on\s+)?([A-Z]{1,5})\b',
+    r'\blong\s+([A-Z]{1,5})\b',
+    r'\bbuy(?:ing)?\s+\d+\s*shares?\s+(?:of\s+)?([A-Z]{1,5})\b',
+    r'\bbuy(?:ing)?\s+([A-Z]{1,5})\s+(?:calls?|puts?)\b',
+)]
+
+_SHARES_RE = re.compile(r'\b(\d+)\s*shares?\b', re.IGNORECASE)
+_CONTRACTS_RE = re.compile(r'\b(\d+)\s*(?:contracts?|lots?)\b', re.IGNORECASE)
+_BUY_QTY_RE = re.compile(r'\bbuy(?:ing)?\s+(\d+)\s+', re.IGNORECASE)
+
+_CALLS_WORD_RE = re.compile(r'\bcalls?\b')
+_PUTS_WORD_RE = re.compile(r'\bputs?\b')
+_CALL_SUFFIX_RE = re.compile(r'\d+\s*C\b')
+_PUT_SUFFIX_RE = re.compile(r'\d+\s*P\b')
+
+_STRIKE_SUFFIX_RE = re.compile(r'\b(\d+(?:\.\d+)?)\s*[CP]\b', re.IGNORECASE)
+_STRIKE_DOLLAR_RE = re.compile(r'\$(\d+(?:\.\d+)?)\s+(?:calls?|puts?)', re.IGNORECASE)
+
+_COMMON_TICKERS = [
+    'SPY', 'QQQ', 'IWM', 'DIA', 'SPX', 'NDX', 'GLD', 'SLV', 'TLT', 'XLF',
+    'AAPL', 'MSFT', 'GOOGL', 'GOOG', 'AMZN', 'META', 'TSLA', 'NVDA', 'AMD',
+    'NFLX', 'BABA', 'BA', 'DIS', 'JPM', 'V', 'MA', 'WMT', 'HD', 'NKE',
+    'COST', 'MCD', 'SBUX', 'PEP', 'KO', 'XOM', 'CVX', 'CRM', 'ADBE', 'PYPL',
+    'SQ', 'SHOP', 'UBER', 'LYFT', 'COIN', 'ROKU', 'ZM', 'SNAP', 'PINS', 'TWTR',
+    'GME', 'AMC', 'PLTR', 'SOFI', 'RIVN', 'LCID', 'F', 'GM', 'INTC', 'MU',
+    'EOSE', 'VIX', 'USO', 'EEM', 'FXI', 'EWZ', 'GDX', 'GDXJ', 'XLE', 'XLK'
+]
+_COMMON_TICKER_PATTERNS = [
+    (ticker, re.compile(rf'\b{ticker}\b', re.IGNORECASE)) for ticker in _COMMON_TICKERS
+]
+_EXCLUDED_TICKER_WORDS = {
+    'LEAP', 'LEAPS', 'CALL', 'PUT', 'BEAR', 'BULL', 'DAY', 'NEXT', 'THE', 'AND',
+    'BUY', 'SELL', 'OPEN', 'CLOSE', 'LIMIT', 'SIZE', 'EXP', 'WITH', 'FOR',
+    'DEBIT', 'CREDIT', 'SPREAD', 'IRON', 'CONDOR', 'BUTTERFLY', 'STRADDLE',
+    'STRANGLE', 'LIKE', 'SHARE', 'COMMENTS', 'WRITE', 'COMMENT', 'AGO',
+    'VICTORY', 'TRADES', 'VT', 'BULLISH', 'BEARISH'
+}
+_CAPS_WORD_RE = re.compile(r'\b([A-Z]{1,5})\b')
+
+_EXP_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{2,4})\s*(?:exp|expiration)?', re.IGNORECASE)
+_MONTH_EXP_RE = re.compile(r'(\w+)\s+exp', re.IGNORECASE)
+
+_LEG_RE = re.compile(r'(?P<qty>[+-]\d+)\s+(?P<strike>\d+(?:\.\d+)?)\s*(?P<type>[CP])', re.IGNORECASE)
+_SELL_LEG_RE = re.compile(r'sell\s+(?:to\s+open\s+)?(?:the\s+)?(?P<strike>\d+(?:\.\d+)?)\s*(?P<type>call|put)', re.IGNORECASE)
+_BUY_LEG_RE = re.compile(r'buy\s+(?:to\s+open\s+)?(?:the\s+)?(?P<strike>\d+(?:\.\d+)?)\s*(?P<type>call|put)', re.IGNORECASE)
+
+_LIMIT_RANGE_RE = re.compile(r'limit\s+\.?(\d+(?:\.\d+)?)\s*[-–]\s*\.?(\d+(?:\.\d+)?)\s*(debit|credit)', re.IGNORECASE)
+_LIMIT_SINGLE_RE = re.compile(r'limit\s+\.?(\d+(?:\.\d+)?)\s*(debit|credit)', re.IGNORECASE)
+
+_SIZE_PCT_LOWER_RE = re.compile(r'\d+(?:\.\d+)?\s*%\s*size')
+_SIZE_BP_RE = re.compile(r'\$\d+(?:,\d+)*(?:\.\d+)?\s*(?:in\s+)?(?:buying\s+power|bp)')
+_SIZE_CONTRACTS_RE = re.compile(r'\d+\s*(?:contract|lot)s?')
+_SIZE_PCT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*%\s*size', re.IGNORECASE)
+
+_ALERT_SPLIT_RE = re.compile(r'\n\s*\n\s*\n')
+
+
 def parse_alert(raw_text: str) -> Optional[ParsedSignal]:
     """
     Parse a raw alert text into a ParsedSignal object.
@@ -62,23 +166,23 @@ def parse_alert(raw_text: str) -> Optional[ParsedSignal]:
     if long_signal:
         return long_signal
     
-    ticker = extract_ticker_anywhere(text)
-    expiration = extract_expiration(text)
-    legs = extract_legs(text)
+    # Cheapest checks first, so alerts missing a field bail out before the
+    # ticker table scan and leg model construction.
+    if not has_size_indicator(text):
+        return None
     limit_info = extract_limit_price(text)
-    size_pct = extract_size_pct(text)
-    has_size = has_size_indicator(text)
-    
-    if not ticker:
+    if not limit_info:
         return None
+    expiration = extract_expiration(text)
     if not expiration:
         return None
+    legs = extract_legs(text)
     if not legs:
         return None
-    if not limit_info:
-        return None
-    if not has_size:
+    ticker = extract_ticker_anywhere(text)
+    if not ticker:
         return None
+    size_pct = extract_size_pct(text)
     
     limit_min, limit_max, limit_kind = limit_info
     
@@ -107,23 +211,8 @@ def is_non_signal_content(text: str) -> bool:
     """
     text_lower = text.lower()
     
-    non_signal_patterns = [
-        r'\bwill be assigned\b',
-        r'\bgot assigned\b',
-        r'\bwas assigned\b',
-        r'\bassignment\b',
-        r'\bwatch out\b',
-        r'\bmarket is doing\b',
-        r'\bmarket update\b',
-        r'\bI\'m cool with\b',
-        r'\bmax profit\b.*\bclosed\b',
-        r'\bhit max profit\b',
-    ]
-    
-    for pattern in non_signal_patterns:
-        if re.search(pattern, text_lower):
-            if not has_trade_structure(text):
-                return True
+    if _NON_SIGNAL_RE.search(text_lower) and not has_trade_structure(text):
+        return True
     
     if len(text) < 40:
         if not _looks_like_long_position(text):
@@ -137,21 +226,15 @@ def is_non_signal_content(text: str) -> bool:
 
 def _looks_like_long_position(text: str) -> bool:
     """Quick check if text looks like a long position alert (used before full parsing)."""
-    long_patterns = [
-        r'\blong\s+[A-Z]{1,5}\b',
-        r'\bbuy(?:ing)?\s+\d+\s*shares?\s+(?:of\s+)?[A-Z]{1,5}\b',
-        r'\bbuy(?:ing)?\s+[A-Z]{1,5}\s+(?:calls?|puts?)\b',
-        r'\bgoing\s+long\b',
-    ]
-    for pattern in long_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
+    for pattern in _LOOKS_LONG_PATTERNS:
+        if pattern.search(text):
             return True
     return False
 
 
 def has_trade_structure(text: str) -> bool:
     """Check if text has the structure of a trade alert."""
-    has_leg = bool(re.search(r'[+-]\d+\s+\d+\s*[CP]', text, re.IGNORECASE))
+    has_leg = bool(_TRADE_LEG_RE.search(text))
     has_limit = 'limit' in text.lower()
     has_size = has_size_indicator(text)
     
@@ -162,19 +245,8 @@ def is_exit_signal(text: str) -> bool:
     """Check if this is an exit/close signal."""
     text_lower = text.lower()
     
-    exit_patterns = [
-        r'\bexit\b',
-        r'\btake profits?\b',
-        r'\bcut\s+(the\s+)?position\b',
-        r'\bclose\s+(the\s+)?position\b',
-        r'\bclose\s+(it|this)\b',
-        r'\bclosing\b.*\bposition\b',
-        r'\bselling?\s+to\s+close\b',
-        r'\bbuy\s+to\s+close\b',
-    ]
-    
-    for pattern in exit_patterns:
-        if re.search(pattern, text_lower):
+    for pattern in _EXIT_PATTERNS:
+        if pattern.search(text_lower):
             return True
     
     return False
@@ -190,16 +262,8 @@ def is_long_position(text: str) -> bool:
     - "Buying QQQ calls"
     - "Going long on NVDA"
     """
-    long_patterns = [
-        r'\blong\s+[A-Z]{1,5}\b',
-        r'\bbuy(?:ing)?\s+\d+\s*shares?\s+(?:of\s+)?[A-Z]{1,5}\b',
-        r'\bbuy(?:ing)?\s+[A-Z]{1,5}\s+(?:calls?|puts?)\b',
-        r'\bgoing\s+long\s+(?:on\s+)?[A-Z]{1,5}\b',
-        r'\blong\s+[A-Z]{1,5}\s+\d+\s*[CP]\b',
-    ]
-    
-    for pattern in long_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
+    for pattern in _LONG_POSITION_PATTERNS:
+        if pattern.search(text):
             return True
     
     return False
@@ -256,15 +320,8 @@ def parse_long_position(text: str, raw_text: str) -> Optional[ParsedSignal]:
 
 def extract_ticker_for_long(text: str) -> Optional[str]:
     """Extract ticker specifically from long position patterns."""
-    patterns = [
-        r'\bgoing\s+long\s+(?:on\s+)?([A-Z]{1,5})\b',
-        r'\blong\s+([A-Z]{1,5})\b',
-        r'\bbuy(?:ing)?\s+\d+\s*shares?\s+(?:of\s+)?([A-Z]{1,5})\b',
-        r'\bbuy(?:ing)?\s+([A-Z]{1,5})\s+(?:calls?|puts?)\b',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _LONG_TICKER_PATTERNS:
+        match = pattern.search(text)
         if match:
             ticker = match.group(1).upper()
             if ticker not in {'ON', 'OF', 'THE', 'A', 'AN'}:
@@ -275,18 +332,15 @@ def extract_ticker_for_long(text: str) -> Optional[str]:
 
 def extract_long_quantity(text: str) -> int:
     """Extract quantity (shares or contracts) from long position alert."""
-    shares_pattern = r'\b(\d+)\s*shares?\b'
-    match = re.search(shares_pattern, text, re.IGNORECASE)
+    match = _SHARES_RE.search(text)
     if match:
         return int(match.group(1))
     
-    contracts_pattern = r'\b(\d+)\s*(?:contracts?|lots?)\b'
-    match = re.search(contracts_pattern, text, re.IGNORECASE)
+    match = _CONTRACTS_RE.search(text)
     if match:
         return int(match.group(1))
     
-    qty_pattern = r'\bbuy(?:ing)?\s+(\d+)\s+'
-    match = re.search(qty_pattern, text, re.IGNORECASE)
+    match = _BUY_QTY_RE.search(text)
     if match:
         return int(match.group(1))
     
@@ -297,14 +351,14 @@ def extract_long_option_type(text: str) -> Optional[Literal["CALL", "PUT"]]:
     """Extract option type (CALL or PUT) from long position alert."""
     text_lower = text.lower()
     
-    if re.search(r'\bcalls?\b', text_lower):
+    if _CALLS_WORD_RE.search(text_lower):
         return "CALL"
-    if re.search(r'\bputs?\b', text_lower):
+    if _PUTS_WORD_RE.search(text_lower):
         return "PUT"
     
-    if re.search(r'\d+\s*C\b', text):
+    if _CALL_SUFFIX_RE.search(text):
         return "CALL"
-    if re.search(r'\d+\s*P\b', text):
+    if _PUT_SUFFIX_RE.search(text):
         return "PUT"
     
     return None
@@ -312,13 +366,11 @@ def extract_long_option_type(text: str) -> Optional[Literal["CALL", "PUT"]]:
 
 def extract_long_strike(text: str) -> Optional[float]:
     """Extract strike price from long position alert."""
-    strike_pattern = r'\b(\d+(?:\.\d+)?)\s*[CP]\b'
-    match = re.search(strike_pattern, text, re.IGNORECASE)
+    match = _STRIKE_SUFFIX_RE.search(text)
     if match:
         return float(match.group(1))
     
-    strike_pattern2 = r'\$(\d+(?:\.\d+)?)\s+(?:calls?|puts?)'
-    match = re.search(strike_pattern2, text, re.IGNORECASE)
+    match = _STRIKE_DOLLAR_RE.search(text)
     if match:
         return float(match.group(1))
     
@@ -330,38 +382,66 @@ def extract_ticker_anywhere(text: str) -> Optional[str]:
     Extract ticker symbol from anywhere in the text.
     Looks for 1-5 capital letter words that are likely tickers.
     """
-    common_tickers = [
-        'SPY', 'QQQ', 'IWM', 'DIA', 'SPX', 'NDX', 'GLD', 'SLV', 'TLT', 'XLF',
-        'AAPL', 'MSFT', 'GOOGL', 'GOOG', 'AMZN', 'META', 'TSLA', 'NVDA', 'AMD',
-        'NFLX', 'BABA', 'BA', 'DIS', 'JPM', 'V', 'MA', 'WMT', 'HD', 'NKE',
-        'COST', 'MCD', 'SBUX', 'PEP', 'KO', 'XOM', 'CVX', 'CRM', 'ADBE', 'PYPL',
-        'SQ', 'SHOP', 'UBER', 'LYFT', 'COIN', 'ROKU', 'ZM', 'SNAP', 'PINS', 'TWTR',
-        'GME', 'AMC', 'PLTR', 'SOFI', 'RIVN', 'LCID', 'F', 'GM', 'INTC', 'MU',
-        'EOSE', 'VIX', 'USO', 'EEM', 'FXI', 'EWZ', 'GDX', 'GDXJ', 'XLE', 'XLK'
-    ]
-    
-    excluded_words = {
-        'LEAP', 'LEAPS', 'CALL', 'PUT', 'BEAR', 'BULL', 'DAY', 'NEXT', 'THE', 'AND',
-        'BUY', 'SELL', 'OPEN', 'CLOSE', 'LIMIT', 'SIZE', 'EXP', 'WITH', 'FOR',
-        'DEBIT', 'CREDIT', 'SPREAD', 'IRON', 'CONDOR', 'BUTTERFLY', 'STRADDLE',
-        'STRANGLE', 'LIKE', 'SHARE', 'COMMENTS', 'WRITE', 'COMMENT', 'AGO',
-        'VICTORY', 'TRADES', 'VT', 'BULLISH', 'BEARISH'
-    }
-    
-    for ticker in common_tickers:
-        if re.search(rf'\b{ticker}\b', text, re.IGNORECASE):
+    for ticker, pattern in _COMMON_TICKER_PATTERNS:
+        if pattern.search(text):
             return ticker
     
-    words = re.findall(r'\b([A-Z]{1,5})\b', text)
+    words = _CAPS_WORD_RE.findall(text)
     
     for word in words:
-        if word not in excluded_words:
+        if word not in _EXCLUDED_TICKER_WORDS:
             if len(word) >= 2 or word in ['F', 'V', 'X']:
                 return word
     
     return None
 
 
+def _scan_slash_date(text: str) -> Optional[tuple[str, Optional[date]]]:
+    """
+    Find the first M/D/YY(YY) date in ASCII text, matching what
+    _EXP_DATE_RE would capture, without going through the regex engine.
+    
+    Returns (matched text, date), where date is None when the fields need
+    dateutil's handling (invalid month/day order, 3-digit years, etc.),
+    or None if there is no such date.
+    """
+    b = text.encode('ascii')
+    n = len(b)
+    slash = b.find(b'/')
+    while slash >= 0:
+        start = slash
+        while start > 0 and slash - start < 2 and 48 <= b[start - 1] <= 57:
+            start -= 1
+        if start < slash:
+            day_start = day_end = slash + 1
+            while day_end < n and day_end - day_start < 2 and 48 <= b[day_end] <= 57:
+                day_end += 1
+            if day_start < day_end < n and b[day_end] == 47:
+                year_start = year_end = day_end + 1
+                while year_end < n and year_end - year_start < 4 and 48 <= b[year_end] <= 57:
+                    year_end += 1
+                year_len = year_end - year_start
+                if year_len >= 2:
+                    date_str = text[start:year_end]
+                    year = int(b[year_start:year_end])
+                    if year_len == 2:
+                        # Same two-digit year window as dateutil
+                        this_year = date.today().year
+                        year += this_year // 100 * 100
+                        if year >= this_year + 50:
+                            year -= 100
+                        elif year < this_year - 50:
+                            year += 100
+                    elif year_len != 4 or year < 1000:
+                        return date_str, None
+                    try:
+                        return date_str, date(year, int(b[start:slash]), int(b[day_start:day_end]))
+                    except ValueError:
+                        return date_str, None
+        slash = b.find(b'/', slash + 1)
+    return None
+
+
 def extract_expiration(text: str) -> Optional[date]:
     """
     Extract expiration date from text.
@@ -371,11 +451,19 @@ def extract_expiration(text: str) -> Optional[date]:
     - 6/17/2027
     - December exp
     """
-    exp_pattern = r'(\d{1,2}/\d{1,2}/\d{2,4})\s*(?:exp|expiration)?'
-    match = re.search(exp_pattern, text, re.IGNORECASE)
+    if text.isascii():
+        scanned = _scan_slash_date(text)
+        if scanned is None:
+            date_str = None
+        else:
+            date_str, fast = scanned
+            if fast is not None:
+                return fast
+    else:
+        match = _EXP_DATE_RE.search(text)
+        date_str = match.group(1) if match else None
     
-    if match:
-        date_str = match.group(1)
+    if date_str:
         try:
             parsed = date_parser.parse(date_str)
             if parsed.year < 100:
@@ -387,8 +475,7 @@ def extract_expiration(text: str) -> Optional[date]:
         except (ValueError, TypeError):
             pass
     
-    month_exp_pattern = r'(\w+)\s+exp'
-    match = re.search(month_exp_pattern, text, re.IGNORECASE)
+    match = _MONTH_EXP_RE.search(text)
     if match:
         month_name = match.group(1)
         try:
@@ -411,46 +498,27 @@ def extract_legs(text: str) -> list[OptionLeg]:
     - Sell to open the 15 put
     - Buy the 420 call
     """
-    legs = []
-    
-    leg_pattern = r'([+-]\d+)\s+(\d+(?:\.\d+)?)\s*([CP])'
-    matches = re.findall(leg_pattern, text, re.IGNORECASE)
-    
-    for qty_str, strike_str, opt_type in matches:
-        quantity = int(qty_str)
-        strike = float(strike_str)
-        
-        side = "BUY" if quantity > 0 else "SELL"
-        abs_quantity = abs(quantity)
-        option_type = "CALL" if opt_type.upper() == "C" else "PUT"
-        
-        legs.append(OptionLeg(
-            side=side,
-            quantity=abs_quantity,
-            strike=strike,
-            option_type=option_type
-        ))
+    legs = [
+        OptionLeg(
+            side="BUY" if int(m['qty']) > 0 else "SELL",
+            quantity=abs(int(m['qty'])),
+            strike=float(m['strike']),
+            option_type="CALL" if m['type'] in ("C", "c") else "PUT"
+        )
+        for m in _LEG_RE.finditer(text)
+    ]
     
     if not legs:
-        sell_pattern = r'sell\s+(?:to\s+open\s+)?(?:the\s+)?(\d+(?:\.\d+)?)\s*(call|put)'
-        sell_matches = re.findall(sell_pattern, text, re.IGNORECASE)
-        for strike_str, opt_type in sell_matches:
-            legs.append(OptionLeg(
-                side="SELL",
-                quantity=1,
-                strike=float(strike_str),
-                option_type="CALL" if opt_type.lower() == "call" else "PUT"
-            ))
-        
-        buy_pattern = r'buy\s+(?:to\s+open\s+)?(?:the\s+)?(\d+(?:\.\d+)?)\s*(call|put)'
-        buy_matches = re.findall(buy_pattern, text, re.IGNORECASE)
-        for strike_str, opt_type in buy_matches:
-            legs.append(OptionLeg(
-                side="BUY",
-                quantity=1,
-                strike=float(strike_str),
-                option_type="CALL" if opt_type.lower() == "call" else "PUT"
-            ))
+        for side, pattern in (("SELL", _SELL_LEG_RE), ("BUY", _BUY_LEG_RE)):
+            legs.extend(
+                OptionLeg(
+                    side=side,
+                    quantity=1,
+                    strike=float(m['strike']),
+                    option_type="CALL" if m['type'].lower() == "call" else "PUT"
+                )
+                for m in pattern.finditer(text)
+            )
     
     return legs
 
@@ -466,8 +534,7 @@ def extract_limit_price(text: str) -> Optional[tuple[float, float, str]]:
     - Limit .15 credit
     - Limit 1.85 debit
     """
-    range_pattern = r'limit\s+\.?(\d+(?:\.\d+)?)\s*[-–]\s*\.?(\d+(?:\.\d+)?)\s*(debit|credit)'
-    match = re.search(range_pattern, text, re.IGNORECASE)
+    match = _LIMIT_RANGE_RE.search(text)
     
     if match:
         min_price = float(match.group(1))
@@ -479,8 +546,7 @@ def extract_limit_price(text: str) -> Optional[tuple[float, float, str]]:
         
         return (min_price, max_price, kind)
     
-    single_pattern = r'limit\s+\.?(\d+(?:\.\d+)?)\s*(debit|credit)'
-    match = re.search(single_pattern, text, re.IGNORECASE)
+    match = _LIMIT_SINGLE_RE.search(text)
     
     if match:
         price = float(match.group(1))
@@ -494,13 +560,13 @@ def has_size_indicator(text: str) -> bool:
     """Check if text contains a size indicator."""
     text_lower = text.lower()
     
-    if re.search(r'\d+(?:\.\d+)?\s*%\s*size', text_lower):
+    if _SIZE_PCT_LOWER_RE.search(text_lower):
         return True
     
-    if re.search(r'\$\d+(?:,\d+)*(?:\.\d+)?\s*(?:in\s+)?(?:buying\s+power|bp)', text_lower):
+    if _SIZE_BP_RE.search(text_lower):
         return True
     
-    if re.search(r'\d+\s*(?:contract|lot)s?', text_lower):
+    if _SIZE_CONTRACTS_RE.search(text_lower):
         return True
     
     return False
@@ -512,8 +578,7 @@ def extract_size_pct(text: str) -> float:
     Returns as decimal (e.g., 0.02 for 2%).
     Falls back to config.DEFAULT_SIZE_PCT if not found.
     """
-    size_pattern = r'(\d+(?:\.\d+)?)\s*%\s*size'
-    match = re.search(size_pattern, text, re.IGNORECASE)
+    match = _SIZE_PCT_RE.search(text)
     
     if match:
         pct = float(match.group(1))
@@ -528,8 +593,8 @@ def determine_strategy(text: str, limit_kind: str) -> str:
     """
     text_lower = text.lower()
     
-    has_put = 'put' in text_lower or re.search(r'\d+\s*P\b', text)
-    has_call = 'call' in text_lower or re.search(r'\d+\s*C\b', text)
+    has_put = 'put' in text_lower or _PUT_SUFFIX_RE.search(text)
+    has_call = 'call' in text_lower or _CALL_SUFFIX_RE.search(text)
     
     if limit_kind == "DEBIT":
         if has_put and not has_call:
@@ -541,10 +606,17 @@ def determine_strategy(text: str, limit_kind: str) -> str:
         return "CALL_CREDIT_SPREAD"
 
 
+@lru_cache(maxsize=2048)
 def get_alert_hash(raw_text: str) -> str:
-    """Generate a hash for an alert to detect duplicates."""
+    """
+    Generate a hash for an alert to detect duplicates.
+    
+    Hashes are persisted in BotState.processed_alert_hashes, so the
+    normalization and digest must stay stable. Each polling cycle re-fetches
+    mostly the same alerts, hence the cache.
+    """
     normalized = ' '.join(raw_text.lower().split())
-    return hashlib.md5(normalized.encode()).hexdigest()
+    return hashlib.md5(normalized.encode(), usedforsecurity=False).hexdigest()
 
 
 def parse_multiple_alerts(text: str) -> list[ParsedSignal]:
@@ -554,7 +626,7 @@ def parse_multiple_alerts(text: str) -> list[ParsedSignal]:
     """
     alerts = []
     
-    chunks = re.split(r'\n\s*\n\s*\n', text)
+    chunks = _ALERT_SPLIT_RE.split(text)
     
     for chunk in chunks:
         chunk = chunk.strip()
@@ -387,7 +387,10 @@ def _build_intent_legs(legs_data: list, expiration: Optional[str]) -> list[Inten
             elif not isinstance(leg_exp, str):
                 leg_exp = expiration or ""
             
-            intent_legs.append(IntentOptionLeg(
+            # Every field is normalised above; only a zero quantity still
+            # needs the validating constructor (which rejects it).
+            make_leg = IntentOptionLeg.internal if quantity > 0 else IntentOptionLeg
+            intent_legs.append(make_leg(
                 side=side,
                 quantity=quantity,
                 strike=strike,
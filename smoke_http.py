@@ -0,0 +1,104 @@
+"""
+HTTP helpers shared by the broker smoke tests.
+Provides per-broker keep-alive sessions and response decoding.
+"""
+
+import threading
+from typing import Any, Dict, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+
+# orjson is optional; it decodes the option chain several times faster
+# than the stdlib json module behind resp.json().
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson is optional (the "streaming" extra); with it an option chain is
+# counted as it streams in instead of being decoded into a dict per contract
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# ijson prefixes of a contract: a list item, or the bare object Tradier
+# sends for a one-contract chain
+_CHAIN_OPTION_PREFIXES = ("options.option.item", "options.option")
+
+# broker -> (auth headers the session was built with, session)
+_SESSIONS: Dict[str, Tuple[Tuple[Tuple[str, str], ...], requests.Session]] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def get_session(broker: str, headers: Dict[str, str]) -> requests.Session:
+    """
+    Get the keep-alive session for a broker, with its auth headers set.
+
+    Requests after the first reuse a pooled connection instead of a new
+    TCP/TLS handshake, and don't pass or merge headers per call. Retries
+    cover idempotent methods only, never the order POSTs.
+
+    Each broker talks to one host with at most three requests in flight,
+    so the pool is small. When a broker's headers change (e.g. a rotated
+    token) its old session is closed and replaced.
+    """
+    key = tuple(sorted(headers.items()))
+    with _SESSIONS_LOCK:
+        cached = _SESSIONS.get(broker)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        session = requests.Session()
+        retry = Retry(total=2, read=False, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504], raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(headers)
+
+        _SESSIONS[broker] = (key, session)
+
+    if cached is not None:
+        cached[1].close()
+    return session
+
+
+def decode_json(resp: requests.Response) -> Any:
+    """
+    Decode a response body. Errors are raised as requests' JSONDecodeError,
+    as resp.json() does, so RequestException handlers still catch them.
+    """
+    if orjson is None:
+        return resp.json()
+    try:
+        return orjson.loads(resp.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos)
+
+
+def count_chain_options(resp: requests.Response) -> int:
+    """
+    Number of contracts in a Tradier chains response. Streaming errors are
+    raised as the requests exceptions resp.json() would give.
+    """
+    if ijson is None:
+        options = decode_json(resp).get("options", {})
+        # An empty chain comes back as "options": "null"
+        option_list = options.get("option", []) if isinstance(options, dict) else []
+        if isinstance(option_list, dict):
+            option_list = [option_list]
+        return len(option_list) if option_list else 0
+
+    resp.raw.decode_content = True
+    try:
+        return sum(
+            1 for prefix, event, _ in ijson.parse(resp.raw)
+            if event == "start_map" and prefix in _CHAIN_OPTION_PREFIXES
+        )
+    except Urllib3HTTPError as e:
+        raise requests.exceptions.ConnectionError(e)
+    except ijson.JSONError as e:
+        raise requests.exceptions.InvalidJSONError(e)
@@ -4,8 +4,8 @@ Strategy rules for trade classification and risk mode enforcement.
 Classifies trades into categories and applies risk mode rules.
 """
 
-from datetime import date, datetime
-from typing import Literal, Optional, Tuple
+from datetime import date
+from typing import Literal, NamedTuple, Optional, Tuple
 
 
 RiskBucket = Literal["defined_risk", "undefined_risk"]
@@ -26,78 +26,51 @@ RISK_MODE_CAPS = {
     },
 }
 
-
-def is_exit_signal(parsed_signal: dict, trade_intent: dict) -> bool:
-    """Check if this is an exit/close signal."""
-    signal_type = parsed_signal.get("signal_type", "").upper()
-    if signal_type in ("EXIT", "CLOSE", "STC", "BTC"):
-        return True
-    
-    action = trade_intent.get("action", "").upper()
-    if action in ("CLOSE", "STC", "BTC"):
-        return True
-    
-    metadata = trade_intent.get("metadata", {})
-    if metadata.get("signal_type", "").upper() in ("EXIT", "CLOSE"):
-        return True
-    
-    return False
-
-
-def is_long_stock_entry(parsed_signal: dict, trade_intent: dict) -> bool:
-    """Check if this is a long stock entry (BTO stock/ETF)."""
-    if is_exit_signal(parsed_signal, trade_intent):
-        return False
-    
-    instrument_type = trade_intent.get("instrument_type", "").lower()
-    if instrument_type not in ("stock", "etf"):
-        return False
-    
-    action = trade_intent.get("action", "").upper()
-    return action in ("BUY", "BTO", "OPEN", "ENTRY")
+_EXIT_SIGNAL_TYPES = frozenset(("EXIT", "CLOSE", "STC", "BTC"))
+_EXIT_ACTIONS = frozenset(("CLOSE", "STC", "BTC"))
+_EXIT_METADATA_SIGNAL_TYPES = frozenset(("EXIT", "CLOSE"))
+_ENTRY_ACTIONS = frozenset(("BUY", "BTO", "OPEN", "ENTRY"))
+_STOCK_INSTRUMENTS = frozenset(("STOCK", "ETF"))
+_OPTION_INSTRUMENTS = frozenset(("OPTION", "INDEX_OPTION"))
+_SPX_UNDERLYINGS = frozenset(("SPX", "$SPX", "SPXW"))
+
+# Values already in canonical (upper-case) form as emitted by signal_to_intent
+# and the TradeIntent literals; only other spellings get normalized.
+_CANONICAL_SIGNAL_TYPES = _EXIT_SIGNAL_TYPES | {"ENTRY", "UNKNOWN", ""}
+_CANONICAL_ACTIONS = _EXIT_ACTIONS | _ENTRY_ACTIONS | {
+    "SELL", "BUY_TO_OPEN", "BUY_TO_CLOSE", "SELL_TO_OPEN", "SELL_TO_CLOSE", "",
+}
+_CANONICAL_INSTRUMENTS = _STOCK_INSTRUMENTS | _OPTION_INSTRUMENTS | {"SPREAD", ""}
 
 
-def is_single_leg_option_entry(parsed_signal: dict, trade_intent: dict) -> bool:
-    """Check if this is a single-leg option entry (undefined risk)."""
-    if is_exit_signal(parsed_signal, trade_intent):
-        return False
-    
-    instrument_type = trade_intent.get("instrument_type", "").lower()
-    if instrument_type not in ("option", "index_option"):
-        return False
-    
-    legs = trade_intent.get("legs", [])
-    return len(legs) == 1
+class TradeClass(NamedTuple):
+    """Result of classifying a signal/intent pair in one pass."""
+    is_exit: bool
+    is_long_stock_entry: bool
+    is_single_leg_option_entry: bool
+    is_spread_entry: bool
+    is_spx_0dte: bool
 
 
-def is_spread_entry(parsed_signal: dict, trade_intent: dict) -> bool:
-    """Check if this is a spread entry (defined risk)."""
-    if is_exit_signal(parsed_signal, trade_intent):
-        return False
-    
-    instrument_type = trade_intent.get("instrument_type", "").lower()
-    if instrument_type == "spread":
-        return True
-    
-    if instrument_type in ("option", "index_option"):
-        legs = trade_intent.get("legs", [])
-        if len(legs) >= 2:
-            return True
-    
-    return False
+# Exit classifications, indexed by is_spx_0dte.
+_EXIT_CLASSES = (
+    TradeClass(True, False, False, False, False),
+    TradeClass(True, False, False, False, True),
+)
 
 
-def is_spx_0dte(trade_intent: dict) -> bool:
-    """Check if this is a 0DTE SPX trade."""
-    underlying = trade_intent.get("underlying", "").upper()
-    if underlying not in ("SPX", "$SPX", "SPXW"):
+def _spx_0dte(trade_intent: dict, today: Optional[date] = None) -> bool:
+    """SPX 0DTE check; legs are only scanned for SPX underlyings."""
+    underlying: str = trade_intent.get("underlying", "")
+    if underlying not in _SPX_UNDERLYINGS and underlying.upper() not in _SPX_UNDERLYINGS:
         return False
     
-    legs = trade_intent.get("legs", [])
+    legs: list = trade_intent.get("legs", [])
     if not legs:
         return False
     
-    today = date.today()
+    if today is None:
+        today = date.today()
     
     for leg in legs:
         exp_str = leg.get("expiration", "")
@@ -106,7 +79,7 @@ def is_spx_0dte(trade_intent: dict) -> bool:
         
         try:
             if isinstance(exp_str, str):
-                exp_date = datetime.strptime(exp_str, "%Y-%m-%d").date()
+                exp_date = date.fromisoformat(exp_str)
             else:
                 exp_date = exp_str
             
@@ -118,6 +91,75 @@ def is_spx_0dte(trade_intent: dict) -> bool:
     return False
 
 
+def _classify(parsed_signal: dict, trade_intent: dict, today: Optional[date] = None) -> TradeClass:
+    """
+    Classify a trade in a single pass over its fields.
+    
+    Kept free of side effects and fully annotated so it can be compiled
+    ahead of time (e.g. mypyc) without changes; the public is_* predicates
+    are thin views over its result. today defaults to date.today() and is
+    only resolved for SPX trades.
+    """
+    spx_0dte: bool = _spx_0dte(trade_intent, today)
+    
+    signal_type: str = parsed_signal.get("signal_type", "")
+    if signal_type not in _CANONICAL_SIGNAL_TYPES:
+        signal_type = signal_type.upper()
+    if signal_type in _EXIT_SIGNAL_TYPES:
+        return _EXIT_CLASSES[spx_0dte]
+    
+    action: str = trade_intent.get("action", "")
+    if action not in _CANONICAL_ACTIONS:
+        action = action.upper()
+    if action in _EXIT_ACTIONS:
+        return _EXIT_CLASSES[spx_0dte]
+    
+    metadata: dict = trade_intent.get("metadata", {})
+    metadata_signal_type: str = metadata.get("signal_type", "")
+    if metadata_signal_type not in _CANONICAL_SIGNAL_TYPES:
+        metadata_signal_type = metadata_signal_type.upper()
+    if metadata_signal_type in _EXIT_METADATA_SIGNAL_TYPES:
+        return _EXIT_CLASSES[spx_0dte]
+    
+    instrument_type: str = trade_intent.get("instrument_type", "")
+    if instrument_type not in _CANONICAL_INSTRUMENTS:
+        instrument_type = instrument_type.upper()
+    
+    if instrument_type in _STOCK_INSTRUMENTS:
+        return TradeClass(False, action in _ENTRY_ACTIONS, False, False, spx_0dte)
+    
+    if instrument_type in _OPTION_INSTRUMENTS:
+        num_legs: int = len(trade_intent.get("legs", []))
+        return TradeClass(False, False, num_legs == 1, num_legs >= 2, spx_0dte)
+    
+    return TradeClass(False, False, False, instrument_type == "SPREAD", spx_0dte)
+
+
+def is_exit_signal(parsed_signal: dict, trade_intent: dict) -> bool:
+    """Check if this is an exit/close signal."""
+    return _classify(parsed_signal, trade_intent).is_exit
+
+
+def is_long_stock_entry(parsed_signal: dict, trade_intent: dict) -> bool:
+    """Check if this is a long stock entry (BTO stock/ETF)."""
+    return _classify(parsed_signal, trade_intent).is_long_stock_entry
+
+
+def is_single_leg_option_entry(parsed_signal: dict, trade_intent: dict) -> bool:
+    """Check if this is a single-leg option entry (undefined risk)."""
+    return _classify(parsed_signal, trade_intent).is_single_leg_option_entry
+
+
+def is_spread_entry(parsed_signal: dict, trade_intent: dict) -> bool:
+    """Check if this is a spread entry (defined risk)."""
+    return _classify(parsed_signal, trade_intent).is_spread_entry
+
+
+def is_spx_0dte(trade_intent: dict) -> bool:
+    """Check if this is a 0DTE SPX trade."""
+    return _spx_0dte(trade_intent)
+
+
 def get_trade_risk_bucket(parsed_signal: dict, trade_intent: dict) -> RiskBucket:
     """
     Classify trade into risk bucket.
@@ -125,10 +167,9 @@ def get_trade_risk_bucket(parsed_signal: dict, trade_intent: dict) -> RiskBucket
     - defined_risk: spreads, exits
     - undefined_risk: single-leg options, long stock
     """
-    if is_exit_signal(parsed_signal, trade_intent):
-        return "defined_risk"
+    trade_class = _classify(parsed_signal, trade_intent)
     
-    if is_spread_entry(parsed_signal, trade_intent):
+    if trade_class.is_exit or trade_class.is_spread_entry:
         return "defined_risk"
     
     return "undefined_risk"
@@ -151,7 +192,7 @@ def check_risk_mode_allows(
         - allowed: True if trade is allowed
         - block_reason: Reason for blocking, or None if allowed
     """
-    if is_spx_0dte(trade_intent) and not allow_0dte_spx:
+    if _spx_0dte(trade_intent) and not allow_0dte_spx:
         return (False, "0DTE SPX requires ALLOW_0DTE_SPX=true")
     
     return (True, None)
@@ -4,9 +4,13 @@ Generates end-of-day summaries at market close using NYSE calendar.
 """
 
 import os
+import mmap
 import logging
+from functools import lru_cache
+from collections import Counter
+from pathlib import Path
 from datetime import datetime, timedelta, date as date_type
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 import pandas_market_calendars as mcal
@@ -16,20 +20,75 @@ logger = logging.getLogger(__name__)
 NY_TZ = ZoneInfo("America/New_York")
 SUMMARY_BUFFER_MINUTES = 5
 
+_BANNER = "=" * 60
+_RULE = "-" * 40
+_TRADE_FMT_WITH_LEGS = "{i}. [{ts}] {ticker} - {strategy}\n   Status: {status}\n   Legs: {legs}\n".format
+_TRADE_FMT_NO_LEGS = "{i}. [{ts}] {ticker} - {strategy}\n   Status: {status}\n".format
+_SUMMARY_FIELDS = ("timestamp", "status", "ticker", "strategy", "legs")
+
+# Signals logs at least this large are pre-filtered with an mmap scan.
+MMAP_SCAN_MIN_BYTES = 1 << 20
+
+# Output directories already created by this process.
+_ENSURED_DIRS: set = set()
+
+
+SCHEDULE_LOOKBACK_DAYS = 5
+SCHEDULE_LOOKAHEAD_DAYS = 30
+
+# (start, end, {trading date: market close (UTC)}) for the cached NYSE window.
+_SCHEDULE_CACHE: Optional[Tuple[date_type, date_type, Dict[date_type, datetime]]] = None
+
+
+@lru_cache(maxsize=16)
+def _zone(tz: str) -> ZoneInfo:
+    """Resolve a timezone name, reusing NY_TZ for the default zone."""
+    if tz == "America/New_York":
+        return NY_TZ
+    return ZoneInfo(tz)
+
 
 def get_nyse_calendar():
     """Get the NYSE market calendar."""
     return mcal.get_calendar("NYSE")
 
 
+def _get_schedule_for(start: date_type, end: Optional[date_type] = None) -> Dict[date_type, datetime]:
+    """
+    Return market closes keyed by trading date, covering at least [start, end].
+    
+    Building an NYSE schedule walks every holiday rule and constructs a
+    DataFrame, so one rolling window is built and reused for all single-day
+    lookups; it is rebuilt only when a query falls outside it.
+    """
+    global _SCHEDULE_CACHE
+    
+    if end is None:
+        end = start
+    
+    cached = _SCHEDULE_CACHE
+    if cached is not None and cached[0] <= start and end <= cached[1]:
+        return cached[2]
+    
+    window_start = start - timedelta(days=SCHEDULE_LOOKBACK_DAYS)
+    window_end = max(end, start + timedelta(days=SCHEDULE_LOOKAHEAD_DAYS))
+    
+    schedule = get_nyse_calendar().schedule(
+        start_date=window_start.isoformat(),
+        end_date=window_end.isoformat()
+    )
+    closes = {
+        session.date(): market_close
+        for session, market_close in schedule['market_close'].items()
+    }
+    
+    _SCHEDULE_CACHE = (window_start, window_end, closes)
+    return closes
+
+
 def is_trading_day(date_obj: date_type) -> bool:
     """Check if a given date is a trading day."""
-    calendar = get_nyse_calendar()
-    schedule = calendar.schedule(
-        start_date=date_obj.isoformat(),
-        end_date=date_obj.isoformat()
-    )
-    return len(schedule) > 0
+    return date_obj in _get_schedule_for(date_obj)
 
 
 def get_market_close_time(date_obj: date_type) -> Optional[datetime]:
@@ -38,16 +97,11 @@ def get_market_close_time(date_obj: date_type) -> Optional[datetime]:
     Returns timezone-aware datetime in America/New_York.
     Returns None if not a trading day.
     """
-    calendar = get_nyse_calendar()
-    schedule = calendar.schedule(
-        start_date=date_obj.isoformat(),
-        end_date=date_obj.isoformat()
-    )
+    market_close_utc = _get_schedule_for(date_obj).get(date_obj)
     
-    if len(schedule) == 0:
+    if market_close_utc is None:
         return None
     
-    market_close_utc = schedule.iloc[0]['market_close']
     market_close_ny = market_close_utc.astimezone(NY_TZ)
     
     return market_close_ny
@@ -64,40 +118,33 @@ def get_today_market_close_run_time(tz: str = "America/New_York") -> Optional[da
     Returns:
         datetime: The time to run the summary (close + 5 min), or None if not trading day
     """
-    tz_info = ZoneInfo(tz)
+    tz_info = _zone(tz)
     now = datetime.now(tz_info)
     today = now.date()
     
     market_close = get_market_close_time(today)
     
     if market_close is None:
-        logger.debug(f"{today} is not a trading day")
+        logger.debug("%s is not a trading day", today)
         return None
     
     run_time = market_close + timedelta(minutes=SUMMARY_BUFFER_MINUTES)
     
-    logger.debug(f"Market close: {market_close}, Summary run time: {run_time}")
+    logger.debug("Market close: %s, Summary run time: %s", market_close, run_time)
     
     return run_time
 
 
 def get_next_trading_day(from_date: date_type) -> Optional[date_type]:
     """Get the next trading day after the given date."""
-    calendar = get_nyse_calendar()
-    
     search_start = from_date + timedelta(days=1)
     search_end = from_date + timedelta(days=10)
     
-    schedule = calendar.schedule(
-        start_date=search_start.isoformat(),
-        end_date=search_end.isoformat()
-    )
+    closes = _get_schedule_for(search_start, search_end)
     
-    if len(schedule) > 0:
-        first_date = schedule.index[0]
-        if hasattr(first_date, 'to_pydatetime'):
-            return first_date.to_pydatetime().date()
-        return first_date.date()
+    for session_date in sorted(closes):
+        if search_start <= session_date <= search_end:
+            return session_date
     
     return None
 
@@ -107,7 +154,7 @@ def get_next_summary_run_time(tz: str = "America/New_York") -> Optional[datetime
     Get the next summary run time (today if not yet run, else next trading day).
     Returns timezone-aware datetime.
     """
-    tz_info = ZoneInfo(tz)
+    tz_info = _zone(tz)
     now = datetime.now(tz_info)
     today = now.date()
     
@@ -125,6 +172,48 @@ def get_next_summary_run_time(tz: str = "America/New_York") -> Optional[datetime
     return None
 
 
+def _scan_candidate_lines(f, date_prefixes) -> Optional[List[str]]:
+    """
+    Pre-filter a large signals log without tokenizing every row.
+    
+    When the file is at least MMAP_SCAN_MIN_BYTES and its first column is the
+    timestamp, the file is memory-mapped and searched for lines starting with
+    one of date_prefixes. Returns the header line followed by those lines in
+    file order, or None if the file should be read normally.
+    """
+    import csv
+    
+    fileno = f.fileno()
+    if os.fstat(fileno).st_size < MMAP_SCAN_MIN_BYTES:
+        return None
+    
+    with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mm:
+        header_end = mm.find(b"\n")
+        if header_end < 0:
+            return None
+        
+        header = mm[:header_end].rstrip(b"\r").decode("utf-8", "replace")
+        if next(csv.reader([header]), [None])[0] != "timestamp":
+            return None
+        
+        starts = []
+        for prefix in date_prefixes:
+            needle = b"\n" + prefix.encode("ascii")
+            pos = mm.find(needle, header_end)
+            while pos >= 0:
+                starts.append(pos + 1)
+                pos = mm.find(needle, pos + 1)
+        
+        lines = [header]
+        for start in sorted(starts):
+            end = mm.find(b"\n", start)
+            if end < 0:
+                end = len(mm)
+            lines.append(mm[start:end].rstrip(b"\r").decode("utf-8", "replace"))
+    
+    return lines
+
+
 def generate_daily_summary(trading_date: date_type, signals_log_file: str) -> str:
     """
     Generate a daily summary for the given trading date.
@@ -139,9 +228,9 @@ def generate_daily_summary(trading_date: date_type, signals_log_file: str) -> st
     import csv
     
     summary_lines = []
-    summary_lines.append("=" * 60)
+    summary_lines.append(_BANNER)
     summary_lines.append(f"DAILY TRADE SUMMARY - {trading_date.isoformat()}")
-    summary_lines.append("=" * 60)
+    summary_lines.append(_BANNER)
     summary_lines.append("")
     
     market_close = get_market_close_time(trading_date)
@@ -155,36 +244,72 @@ def generate_daily_summary(trading_date: date_type, signals_log_file: str) -> st
     
     trades = []
     
-    if os.path.exists(signals_log_file):
+    try:
+        f = open(signals_log_file, 'r', newline='')
+    except FileNotFoundError:
+        f = None
+    except Exception as e:
+        logger.error(f"Error reading signals log: {e}")
+        f = None
+    
+    # Cheap string filter before parsing: a naive timestamp belongs to
+    # trading_date only if it starts with its ISO date, and an offset-aware
+    # one can shift by at most one day when converted to New York time.
+    date_prefix = trading_date.isoformat()
+    nearby_prefixes = {
+        (trading_date - timedelta(days=1)).isoformat(),
+        date_prefix,
+        (trading_date + timedelta(days=1)).isoformat(),
+    }
+    
+    if f is not None:
         try:
-            with open(signals_log_file, 'r') as f:
-                reader = csv.DictReader(f)
+            with f:
+                candidate_lines = _scan_candidate_lines(f, nearby_prefixes)
+                reader = csv.reader(f if candidate_lines is None else candidate_lines)
+                header = next(reader, [])
+                # Column positions for the few fields the summary uses, so
+                # rows are indexed directly instead of built into dicts.
+                columns = [
+                    (name, header.index(name))
+                    for name in _SUMMARY_FIELDS
+                    if name in header
+                ]
+                ix_ts = dict(columns).get('timestamp')
+                if ix_ts is None:
+                    # No timestamp column, so no row can match trading_date
+                    reader = iter(())
+                
                 for row in reader:
+                    ts_str = row[ix_ts] if ix_ts < len(row) else ''
+                    if ts_str[:10] not in nearby_prefixes:
+                        continue
                     try:
-                        ts = datetime.fromisoformat(row['timestamp'])
+                        ts = datetime.fromisoformat(ts_str)
                         ts_ny = ts.astimezone(NY_TZ) if ts.tzinfo else ts.replace(tzinfo=NY_TZ)
                         
                         if ts_ny.date() == trading_date:
-                            trades.append(row)
-                    except (ValueError, KeyError):
+                            trades.append({
+                                name: row[ix]
+                                for name, ix in columns
+                                if ix < len(row)
+                            })
+                    except ValueError:
                         continue
         except Exception as e:
             logger.error(f"Error reading signals log: {e}")
     
     summary_lines.append(f"Total Signals Processed: {len(trades)}")
-    summary_lines.append("-" * 40)
+    summary_lines.append(_RULE)
     summary_lines.append("")
     
     if trades:
-        by_status = {}
-        by_ticker = {}
+        by_status = Counter()
+        by_ticker = Counter()
         
         for trade in trades:
-            status = trade.get('status', 'UNKNOWN')
-            ticker = trade.get('ticker', 'UNKNOWN')
-            
-            by_status[status] = by_status.get(status, 0) + 1
-            by_ticker[ticker] = by_ticker.get(ticker, 0) + 1
+            by_status[trade.get('status', 'UNKNOWN')] += 1
+            by_ticker[trade.get('ticker', 'UNKNOWN')] += 1
         
         summary_lines.append("By Status:")
         for status, count in sorted(by_status.items()):
@@ -197,27 +322,29 @@ def generate_daily_summary(trading_date: date_type, signals_log_file: str) -> st
         summary_lines.append("")
         
         summary_lines.append("Trade Details:")
-        summary_lines.append("-" * 40)
+        summary_lines.append(_RULE)
         
+        # One pre-bound str.format per trade; each entry ends with "\n" so the
+        # final join reproduces the blank separator line between trades.
         for i, trade in enumerate(trades, 1):
             ts = trade.get('timestamp', '')[:19]
-            ticker = trade.get('ticker', '')
-            strategy = trade.get('strategy', '')
-            status = trade.get('status', '')
             legs = trade.get('legs', '')
-            
-            summary_lines.append(f"{i}. [{ts}] {ticker} - {strategy}")
-            summary_lines.append(f"   Status: {status}")
-            if legs:
-                summary_lines.append(f"   Legs: {legs}")
-            summary_lines.append("")
+            fmt = _TRADE_FMT_WITH_LEGS if legs else _TRADE_FMT_NO_LEGS
+            summary_lines.append(fmt(
+                i=i,
+                ts=ts,
+                ticker=trade.get('ticker', ''),
+                strategy=trade.get('strategy', ''),
+                status=trade.get('status', ''),
+                legs=legs,
+            ))
     else:
         summary_lines.append("No trades recorded for this day.")
         summary_lines.append("")
     
-    summary_lines.append("=" * 60)
+    summary_lines.append(_BANNER)
     summary_lines.append(f"Generated at: {datetime.now(NY_TZ).isoformat()}")
-    summary_lines.append("=" * 60)
+    summary_lines.append(_BANNER)
     
     return "\n".join(summary_lines)
 
@@ -234,15 +361,16 @@ def write_daily_summary(trading_date: date_type, signals_log_file: str, output_d
     Returns:
         str: Path to the written summary file
     """
-    os.makedirs(output_dir, exist_ok=True)
+    if output_dir not in _ENSURED_DIRS:
+        os.makedirs(output_dir, exist_ok=True)
+        _ENSURED_DIRS.add(output_dir)
     
     summary_text = generate_daily_summary(trading_date, signals_log_file)
     
     filename = f"daily_summary_{trading_date.isoformat()}.txt"
     filepath = os.path.join(output_dir, filename)
     
-    with open(filepath, 'w') as f:
-        f.write(summary_text)
+    Path(filepath).write_text(summary_text)
     
     logger.info(f"Daily summary written to: {filepath}")
     
@@ -5,15 +5,31 @@ Tests each system layer in order, stopping if any layer fails.
 No assumptions. No skipping steps.
 """
 
+import ast
+import io
 import json
+import mmap
+import re
 import os
 import sys
 import subprocess
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
+# orjson is optional; it decodes JSONL lines several times faster than json.
+# Its JSONDecodeError subclasses json.JSONDecodeError, so handlers are shared.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 # ANSI color codes for terminal output
 RED = "\033[91m"
 GREEN = "\033[92m"
@@ -27,80 +43,225 @@ RAW_ALERTS_FILE = LOGS_DIR / "alerts_raw.jsonl"
 PARSED_ALERTS_FILE = LOGS_DIR / "alerts_parsed.jsonl"
 EXECUTION_PLAN_FILE = LOGS_DIR / "execution_plan.jsonl"
 
+# Read buffer for streaming JSONL logs
+JSONL_READ_BUFFER = 1 << 20
+
+# Bytes read from the end of a log when looking for its latest timestamp
+TAIL_SCAN_BYTES = 64 * 1024
+TS_ISO_RE = re.compile(rb'"ts_iso"\s*:\s*"([^"]+)"')
+
+# "Last 3" display lines; precision specs truncate the post id and preview
+RAW_ENTRY_FMT = "  {i}. [{ts}] {pid:.8}... {preview:.50}...".format
+PARSED_ENTRY_FMT = "  {i}. [{ts}] {pid:.8}... {cls} | {ticker}".format
+
+# Per-layer status tags for the summary block
+_STATUS_PASS = f"{GREEN}[PASS]{RESET}"
+_STATUS_FAIL = f"{RED}[FAIL]{RESET}"
+
+# Source files inspected by layers 5-7, read in the background during layers 1-4
+STATIC_CHECK_FILES = ("dashboard.py", "signal_classification.py")
+
 # Critical date threshold (signals must be newer than this)
 CRITICAL_DATE = datetime(2025, 12, 26, tzinfo=ZoneInfo("UTC"))
 
 
+# Layer output is collected here and written to stdout once per layer
+_OUT = io.StringIO()
+
+
+def flush_output():
+    """Write buffered layer output to stdout in one call."""
+    text = _OUT.getvalue()
+    if text:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        _OUT.seek(0)
+        _OUT.truncate()
+
+
 def print_header(text: str):
     """Print a formatted header."""
-    print(f"\n{BOLD}{BLUE}{'='*70}{RESET}")
-    print(f"{BOLD}{BLUE}{text:^70}{RESET}")
-    print(f"{BOLD}{BLUE}{'='*70}{RESET}\n")
+    _OUT.write(f"\n{BOLD}{BLUE}{'='*70}{RESET}\n{BOLD}{BLUE}{text:^70}{RESET}\n{BOLD}{BLUE}{'='*70}{RESET}\n\n")
 
 
 def print_pass(message: str):
     """Print a pass message."""
-    print(f"{GREEN}[PASS]{RESET} {message}")
+    _OUT.write(f"{GREEN}[PASS]{RESET} {message}\n")
 
 
 def print_fail(message: str):
     """Print a fail message."""
-    print(f"{RED}[FAIL]{RESET} {message}")
+    _OUT.write(f"{RED}[FAIL]{RESET} {message}\n")
 
 
 def print_warn(message: str):
     """Print a warning message."""
-    print(f"{YELLOW}[WARN]{RESET} {message}")
+    _OUT.write(f"{YELLOW}[WARN]{RESET} {message}\n")
 
 
 def print_info(message: str):
     """Print an info message."""
-    print(f"{BLUE}[INFO]{RESET} {message}")
+    _OUT.write(f"{BLUE}[INFO]{RESET} {message}\n")
 
 
-def parse_jsonl(filepath: Path) -> List[Dict]:
-    """Parse a JSONL file and return list of entries."""
+def iter_jsonl(filepath: Path) -> Iterator[Dict]:
+    """Yield entries from a JSONL file one at a time, without loading the whole file."""
     if not filepath.exists():
-        return []
+        return
     
-    entries = []
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
+        # Binary mode: both decoders accept UTF-8 bytes, so no text decode pass
+        with open(filepath, 'rb', buffering=JSONL_READ_BUFFER) as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    entries.append(json.loads(line))
+                    entry = _json_loads(line)
                 except json.JSONDecodeError as e:
                     print_warn(f"Invalid JSON in {filepath.name}: {e}")
+                    continue
+                yield entry
+    except Exception as e:
+        print_fail(f"Error reading {filepath}: {e}")
+
+
+@lru_cache(maxsize=None)
+def _dir_files(directory: str) -> frozenset:
+    """Names of the regular files in a directory, listed once per run."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(e.name for e in entries if e.is_file())
+    except OSError:
+        return frozenset()
+
+
+def _file_exists(path: str) -> bool:
+    """Check a repository file against the cached directory listing."""
+    directory, name = os.path.split(path)
+    return name in _dir_files(directory or ".")
+
+
+@lru_cache(maxsize=None)
+def _read_text(path: str) -> str:
+    """Read a source file once per run; layers share the cached contents."""
+    return Path(path).read_text(encoding='utf-8')
+
+
+@lru_cache(maxsize=None)
+def _source_symbols(path: str) -> Tuple[frozenset, frozenset]:
+    """
+    Parse a Python source file once and return (defined names, string constants).
+    
+    Defined names are functions, classes, imported names, assignment targets
+    (including attributes such as self.x) and arguments, so mentions in
+    comments or docstrings do not count as definitions.
+    """
+    names = set()
+    strings = set()
+    for node in ast.walk(ast.parse(_read_text(path), filename=path)):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+            names.add(node.id)
+        elif isinstance(node, ast.Attribute) and isinstance(node.ctx, ast.Store):
+            names.add(node.attr)
+        elif isinstance(node, ast.alias) and node.name != "*":
+            # "import a.b" binds "a"; "from m import x as y" binds "y"
+            names.add(node.asname or node.name.split(".")[0])
+        elif isinstance(node, ast.arg):
+            names.add(node.arg)
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            strings.add(node.value)
+    return frozenset(names), frozenset(strings)
+
+
+def tail_jsonl(filepath: Path, n: int = 3) -> List[Dict]:
+    """
+    Return the last n valid entries of an append-only JSONL file.
+    
+    The file is memory-mapped and scanned backwards from the end, so the cost
+    does not depend on file size. Blank and invalid lines are skipped silently.
+    """
+    if n <= 0 or not filepath.exists():
+        return []
+    
+    entries = []
+    try:
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = len(mm)
+                while end > 0 and len(entries) < n:
+                    start = mm.rfind(b'\n', 0, end) + 1
+                    line = mm[start:end].strip()
+                    end = start - 1
+                    if not line:
+                        continue
+                    try:
+                        entries.append(_json_loads(line))
+                    except json.JSONDecodeError:
+                        continue
     except Exception as e:
         print_fail(f"Error reading {filepath}: {e}")
+        return []
     
+    entries.reverse()
     return entries
 
 
-def get_latest_timestamp(entries: List[Dict], field: str = "ts_iso") -> Optional[datetime]:
-    """Get the latest timestamp from entries."""
-    if not entries:
+def latest_timestamp_in_tail(filepath: Path) -> Optional[datetime]:
+    """
+    Return the last valid ts_iso in the final TAIL_SCAN_BYTES of an
+    append-only JSONL log, found by regex without decoding any records.
+    Returns None if the window has no usable timestamp.
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            f.seek(max(0, size - TAIL_SCAN_BYTES))
+            tail = f.read()
+    except OSError:
         return None
     
-    timestamps = []
-    for entry in entries:
-        ts_str = entry.get(field)
-        if not ts_str:
-            continue
+    for raw in reversed(TS_ISO_RE.findall(tail)):
+        ts = parse_timestamp(raw.decode('utf-8', 'replace'))
+        if ts is not None:
+            return ts
+    return None
+
+
+def parse_jsonl(filepath: Path) -> List[Dict]:
+    """Parse a JSONL file and return list of entries."""
+    return list(iter_jsonl(filepath))
+
+
+def parse_timestamp(ts_str) -> Optional[datetime]:
+    """Parse an entry timestamp, or return None if it is missing or invalid."""
+    if not ts_str:
+        return None
+    try:
+        # ISO format first (Python 3.11+ accepts a trailing 'Z'), then plain dates
+        return datetime.fromisoformat(ts_str)
+    except ValueError:
         try:
-            # Handle both ISO format and other formats
-            if 'T' in ts_str:
-                ts = datetime.fromisoformat(ts_str.replace('Z', '+00:00'))
-            else:
-                ts = datetime.strptime(ts_str, '%Y-%m-%d')
-            timestamps.append(ts)
-        except Exception:
-            continue
+            return datetime.strptime(ts_str, '%Y-%m-%d')
+        except ValueError:
+            return None
+    except TypeError:
+        return None
+
+
+def get_latest_timestamp(entries: Iterable[Dict], field: str = "ts_iso") -> Optional[datetime]:
+    """Get the latest timestamp from entries."""
+    latest = None
+    for entry in entries:
+        ts = parse_timestamp(entry.get(field))
+        if ts is not None and (latest is None or ts > latest):
+            latest = ts
     
-    return max(timestamps) if timestamps else None
+    return latest
 
 
 def test_layer_1_worker_process() -> bool:
@@ -111,43 +272,38 @@ def test_layer_1_worker_process() -> bool:
     print_header("LAYER 1: WORKER PROCESS (CRITICAL)")
     
     # Check 1: main.py exists
-    main_py = Path("main.py")
-    if not main_py.exists():
+    if not _file_exists("main.py"):
         print_fail("main.py does not exist at repository root")
         return False
     print_pass("main.py exists")
     
     # Check 2: Verify main.py is a worker script (not a Flask app)
     try:
-        with open(main_py, 'r', encoding='utf-8') as f:
-            content = f.read()
-            if 'Flask' in content and 'app = Flask' in content:
-                print_fail("main.py contains Flask app definition (should be worker only)")
-                return False
-            if 'run_polling_loop' in content or 'get_alerts' in content:
-                print_pass("main.py contains worker logic (polling loop)")
-            else:
-                print_warn("main.py may not contain expected worker logic")
+        content = _read_text("main.py")
+        if 'Flask' in content and 'app = Flask' in content:
+            print_fail("main.py contains Flask app definition (should be worker only)")
+            return False
+        if 'run_polling_loop' in content or 'get_alerts' in content:
+            print_pass("main.py contains worker logic (polling loop)")
+        else:
+            print_warn("main.py may not contain expected worker logic")
     except Exception as e:
         print_fail(f"Error reading main.py: {e}")
         return False
     
     # Check 3: Railway configuration check (informational)
-    railway_toml = Path("railway.toml")
-    if railway_toml.exists():
+    if _file_exists("railway.toml"):
         try:
-            with open(railway_toml, 'r', encoding='utf-8') as f:
-                content = f.read()
-                if 'gunicorn' in content.lower() and 'main' in content.lower():
-                    print_warn("railway.toml may be configured to run main.py via Gunicorn (should use python main.py)")
-                else:
-                    print_info("railway.toml exists (verify Worker Service uses: python main.py)")
+            content = _read_text("railway.toml").lower()
+            if 'gunicorn' in content and 'main' in content:
+                print_warn("railway.toml may be configured to run main.py via Gunicorn (should use python main.py)")
+            else:
+                print_info("railway.toml exists (verify Worker Service uses: python main.py)")
         except Exception:
             pass
     
     # Check 4: web.py exists (for web service)
-    web_py = Path("web.py")
-    if web_py.exists():
+    if _file_exists("web.py"):
         print_pass("web.py exists (for web service)")
     else:
         print_warn("web.py does not exist (web service may fail)")
@@ -175,22 +331,33 @@ def test_layer_2_raw_ingestion() -> bool:
         return False
     print_pass(f"{RAW_ALERTS_FILE} exists")
     
-    # Check 2: File is readable
+    # Check 2: File is readable (one streaming pass for count and tail). The log
+    # is append-only, so the latest timestamp normally comes from a scan of its
+    # last few KiB; every entry's timestamp is parsed only if that finds none.
+    entry_count = 0
+    latest_ts = latest_timestamp_in_tail(RAW_ALERTS_FILE)
+    scan_timestamps = latest_ts is None
+    last_entries = deque(maxlen=3)
     try:
-        entries = parse_jsonl(RAW_ALERTS_FILE)
-        print_pass(f"{RAW_ALERTS_FILE} is readable ({len(entries)} entries)")
+        for entry in iter_jsonl(RAW_ALERTS_FILE):
+            entry_count += 1
+            last_entries.append(entry)
+            if scan_timestamps:
+                ts = parse_timestamp(entry.get("ts_iso"))
+                if ts is not None and (latest_ts is None or ts > latest_ts):
+                    latest_ts = ts
+        print_pass(f"{RAW_ALERTS_FILE} is readable ({entry_count} entries)")
     except Exception as e:
         print_fail(f"Error reading {RAW_ALERTS_FILE}: {e}")
         return False
     
     # Check 3: File has entries
-    if len(entries) == 0:
+    if entry_count == 0:
         print_fail(f"{RAW_ALERTS_FILE} is empty")
         print_info("Worker may not be running or Whop fetch is failing")
         return False
     
     # Check 4: Latest timestamp is current (not stuck at 12/26)
-    latest_ts = get_latest_timestamp(entries, "ts_iso")
     if not latest_ts:
         print_fail("No valid timestamps found in raw alerts")
         return False
@@ -223,11 +390,13 @@ def test_layer_2_raw_ingestion() -> bool:
     
     # Show last 3 entries
     print_info("\nLast 3 raw alerts:")
-    for i, entry in enumerate(entries[-3:], 1):
-        ts = entry.get("ts_iso", "N/A")
-        post_id = entry.get("post_id", "N/A")[:8]
-        body_preview = (entry.get("body", "") or entry.get("title", ""))[:50]
-        print_info(f"  {i}. [{ts}] {post_id}... {body_preview}...")
+    for i, entry in enumerate(last_entries, 1):
+        print_info(RAW_ENTRY_FMT(
+            i=i,
+            ts=entry.get("ts_iso", "N/A"),
+            pid=entry.get("post_id", "N/A"),
+            preview=entry.get("body", "") or entry.get("title", ""),
+        ))
     
     return True
 
@@ -245,16 +414,27 @@ def test_layer_3_parsing() -> bool:
         return False
     print_pass(f"{PARSED_ALERTS_FILE} exists")
     
-    # Check 2: File has entries
-    entries = parse_jsonl(PARSED_ALERTS_FILE)
-    if len(entries) == 0:
+    # Check 2: File has entries (one streaming pass for count, latest timestamp,
+    # classification breakdown and tail)
+    entry_count = 0
+    latest_ts = None
+    classifications = Counter()
+    last_entries = deque(maxlen=3)
+    for entry in iter_jsonl(PARSED_ALERTS_FILE):
+        entry_count += 1
+        last_entries.append(entry)
+        ts = parse_timestamp(entry.get("ts_iso"))
+        if ts is not None and (latest_ts is None or ts > latest_ts):
+            latest_ts = ts
+        classifications[entry.get("classification", "UNKNOWN")] += 1
+    
+    if entry_count == 0:
         print_fail(f"{PARSED_ALERTS_FILE} is empty")
         print_info("Parser may not be running or all alerts are being rejected")
         return False
-    print_pass(f"{PARSED_ALERTS_FILE} has {len(entries)} entries")
+    print_pass(f"{PARSED_ALERTS_FILE} has {entry_count} entries")
     
     # Check 3: Latest timestamp
-    latest_ts = get_latest_timestamp(entries, "ts_iso")
     if not latest_ts:
         print_fail("No valid timestamps found in parsed alerts")
         return False
@@ -265,33 +445,30 @@ def test_layer_3_parsing() -> bool:
         print_fail(f"Latest parsed timestamp ({latest_ts.date()}) is before critical date ({CRITICAL_DATE.date()})")
         return False
     
-    # Check 4: Compare with raw alerts
-    raw_entries = parse_jsonl(RAW_ALERTS_FILE)
-    if raw_entries:
-        raw_latest = get_latest_timestamp(raw_entries, "ts_iso")
+    # Check 4: Compare with raw alerts (append-only, so only the tail is read)
+    raw_tail = tail_jsonl(RAW_ALERTS_FILE)
+    if raw_tail:
+        raw_latest = get_latest_timestamp(raw_tail, "ts_iso")
         if raw_latest and latest_ts < raw_latest:
             print_warn(f"Parsed alerts lag behind raw alerts (parsed: {latest_ts.date()}, raw: {raw_latest.date()})")
         else:
             print_pass("Parsed alerts are up to date with raw alerts")
     
     # Check 5: Show classification breakdown
-    classifications = {}
-    for entry in entries:
-        cls = entry.get("classification", "UNKNOWN")
-        classifications[cls] = classifications.get(cls, 0) + 1
-    
     print_info("\nClassification breakdown:")
-    for cls, count in sorted(classifications.items()):
+    for cls, count in classifications.most_common():
         print_info(f"  {cls}: {count}")
     
     # Show last 3 parsed entries
     print_info("\nLast 3 parsed alerts:")
-    for i, entry in enumerate(entries[-3:], 1):
-        ts = entry.get("ts_iso", "N/A")
-        post_id = entry.get("post_id", "N/A")[:8]
-        cls = entry.get("classification", "N/A")
-        ticker = entry.get("parsed_signal", {}).get("ticker", "N/A") if entry.get("parsed_signal") else "N/A"
-        print_info(f"  {i}. [{ts}] {post_id}... {cls} | {ticker}")
+    for i, entry in enumerate(last_entries, 1):
+        print_info(PARSED_ENTRY_FMT(
+            i=i,
+            ts=entry.get("ts_iso", "N/A"),
+            pid=entry.get("post_id", "N/A"),
+            cls=entry.get("classification", "N/A"),
+            ticker=(entry.get("parsed_signal") or {}).get("ticker", "N/A"),
+        ))
     
     return True
 
@@ -307,34 +484,32 @@ def test_layer_4_storage() -> bool:
     print_header("LAYER 4: STORAGE / DB")
     
     # AutoSig uses JSONL files as storage, so we verify the parsed file
-    entries = parse_jsonl(PARSED_ALERTS_FILE)
+    entry_count = 0
+    sample_entries = []
+    min_ts = max_ts = None
+    for entry in iter_jsonl(PARSED_ALERTS_FILE):
+        entry_count += 1
+        if len(sample_entries) < 10:
+            sample_entries.append(entry)
+        
+        ts = parse_timestamp(entry.get("ts_iso"))
+        if ts is None:
+            continue
+        if max_ts is None or ts > max_ts:
+            max_ts = ts
+        if min_ts is None or ts < min_ts:
+            min_ts = ts
     
-    if len(entries) == 0:
+    if entry_count == 0:
         print_fail("No parsed alerts in storage")
         return False
     
     # Check timestamp range
-    timestamps = []
-    for entry in entries:
-        ts_str = entry.get("ts_iso")
-        if ts_str:
-            try:
-                if 'T' in ts_str:
-                    ts = datetime.fromisoformat(ts_str.replace('Z', '+00:00'))
-                else:
-                    ts = datetime.strptime(ts_str, '%Y-%m-%d')
-                timestamps.append(ts)
-            except Exception:
-                continue
-    
-    if not timestamps:
+    if max_ts is None:
         print_fail("No valid timestamps in storage")
         return False
     
-    max_ts = max(timestamps)
-    min_ts = min(timestamps)
-    
-    print_info(f"Storage contains {len(entries)} entries")
+    print_info(f"Storage contains {entry_count} entries")
     print_info(f"Date range: {min_ts.date()} to {max_ts.date()}")
     
     if max_ts < CRITICAL_DATE:
@@ -346,7 +521,7 @@ def test_layer_4_storage() -> bool:
     # Check for required fields
     required_fields = ["post_id", "ts_iso", "classification"]
     missing_fields = set()
-    for entry in entries[:10]:  # Sample first 10
+    for entry in sample_entries:  # Sample first 10
         for field in required_fields:
             if field not in entry:
                 missing_fields.add(field)
@@ -367,22 +542,19 @@ def test_layer_5_signal_feed() -> bool:
     print_header("LAYER 5: SIGNAL FEED")
     
     # Check 1: Feed template exists
-    feed_template = Path("templates/signal_feed.html")
-    if not feed_template.exists():
+    if not _file_exists("templates/signal_feed.html"):
         print_fail("templates/signal_feed.html does not exist")
         return False
     print_pass("Signal Feed template exists")
     
     # Check 2: Feed API route exists in dashboard.py
-    dashboard_py = Path("dashboard.py")
-    if dashboard_py.exists():
+    if _file_exists("dashboard.py"):
         try:
-            with open(dashboard_py, 'r', encoding='utf-8') as f:
-                content = f.read()
-                if '/api/signals/feed' in content or '/feed' in content:
-                    print_pass("Feed API route exists in dashboard.py")
-                else:
-                    print_warn("Feed API route may not exist in dashboard.py")
+            content = _read_text("dashboard.py")
+            if '/api/signals/feed' in content or '/feed' in content:
+                print_pass("Feed API route exists in dashboard.py")
+            else:
+                print_warn("Feed API route may not exist in dashboard.py")
         except Exception as e:
             print_warn(f"Error checking dashboard.py: {e}")
     
@@ -394,15 +566,13 @@ def test_layer_5_signal_feed() -> bool:
     print_info("  - Certainty shown with (A) or (U)")
     
     # Check 4: Verify certainty resolution function exists
-    signal_classification = Path("signal_classification.py")
-    if signal_classification.exists():
+    if _file_exists("signal_classification.py"):
         try:
-            with open(signal_classification, 'r', encoding='utf-8') as f:
-                content = f.read()
-                if 'resolve_certainty' in content and 'auto_classify_signal' in content:
-                    print_pass("Certainty resolution functions exist")
-                else:
-                    print_warn("Certainty resolution functions may be missing")
+            names, _ = _source_symbols("signal_classification.py")
+            if 'resolve_certainty' in names and 'auto_classify_signal' in names:
+                print_pass("Certainty resolution functions exist")
+            else:
+                print_warn("Certainty resolution functions may be missing")
         except Exception as e:
             print_warn(f"Error checking signal_classification.py: {e}")
     
@@ -417,28 +587,24 @@ def test_layer_6_signal_review() -> bool:
     print_header("LAYER 6: SIGNAL REVIEW")
     
     # Check 1: Review template exists
-    review_template = Path("templates/admin_review.html")
-    if not review_template.exists():
+    if not _file_exists("templates/admin_review.html"):
         print_fail("templates/admin_review.html does not exist")
         return False
     print_pass("Signal Review template exists")
     
     # Check 2: Review API route exists
-    dashboard_py = Path("dashboard.py")
-    if dashboard_py.exists():
+    if _file_exists("dashboard.py"):
         try:
-            with open(dashboard_py, 'r', encoding='utf-8') as f:
-                content = f.read()
-                if '/api/admin/signals' in content or '/signal-review' in content:
-                    print_pass("Review API route exists in dashboard.py")
-                else:
-                    print_warn("Review API route may not exist in dashboard.py")
+            content = _read_text("dashboard.py")
+            if '/api/admin/signals' in content or '/signal-review' in content:
+                print_pass("Review API route exists in dashboard.py")
+            else:
+                print_warn("Review API route may not exist in dashboard.py")
         except Exception as e:
             print_warn(f"Error checking dashboard.py: {e}")
     
     # Check 3: Classification storage exists
-    classification_file = Path("data/signal_classifications.jsonl")
-    if classification_file.exists():
+    if _file_exists("data/signal_classifications.jsonl"):
         print_pass("Classification storage file exists")
     else:
         print_info("Classification storage file does not exist (will be created on first override)")
@@ -460,42 +626,35 @@ def test_layer_7_certainty_overrides() -> bool:
     print_header("LAYER 7: CERTAINTY & OVERRIDES")
     
     # Check 1: Certainty resolution function exists
-    signal_classification = Path("signal_classification.py")
-    if not signal_classification.exists():
+    if not _file_exists("signal_classification.py"):
         print_fail("signal_classification.py does not exist")
         return False
     
     try:
-        with open(signal_classification, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-            checks = [
-                ('resolve_certainty', 'resolve_certainty function'),
-                ('auto_classify_signal', 'auto_classify_signal function'),
-                ('EXECUTABLE', 'EXECUTABLE certainty level'),
-                ('AMBIGUOUS', 'AMBIGUOUS certainty level'),
-                ('LOG-ONLY', 'LOG-ONLY certainty level'),
-            ]
-            
-            for check, name in checks:
-                if check in content:
-                    print_pass(f"{name} exists")
-                else:
-                    print_warn(f"{name} may be missing")
+        names, strings = _source_symbols("signal_classification.py")
     except Exception as e:
         print_fail(f"Error checking signal_classification.py: {e}")
         return False
     
+    checks = [
+        ('resolve_certainty', 'resolve_certainty function'),
+        ('auto_classify_signal', 'auto_classify_signal function'),
+        ('EXECUTABLE', 'EXECUTABLE certainty level'),
+        ('AMBIGUOUS', 'AMBIGUOUS certainty level'),
+        ('LOG-ONLY', 'LOG-ONLY certainty level'),
+    ]
+    
+    for check, name in checks:
+        if check in names or check in strings:
+            print_pass(f"{name} exists")
+        else:
+            print_warn(f"{name} may be missing")
+    
     # Check 2: Verify certainty source logic (A vs U)
-    try:
-        with open(signal_classification, 'r', encoding='utf-8') as f:
-            content = f.read()
-            if 'certainty_source' in content and ('"A"' in content or "'A'" in content):
-                print_pass("Certainty source logic (A/U) appears to be implemented")
-            else:
-                print_warn("Certainty source logic may be incomplete")
-    except Exception:
-        pass
+    if ('certainty_source' in names or 'certainty_source' in strings) and 'A' in strings:
+        print_pass("Certainty source logic (A/U) appears to be implemented")
+    else:
+        print_warn("Certainty source logic may be incomplete")
     
     print_info("NOTE: Cannot test override persistence without running Flask app")
     print_info("ACTION REQUIRED: Test manually:")
@@ -510,9 +669,7 @@ def test_layer_7_certainty_overrides() -> bool:
 
 def main():
     """Run all layer tests in order."""
-    print(f"\n{BOLD}{BLUE}{'='*70}{RESET}")
-    print(f"{BOLD}{BLUE}{'AUTOSIG v1.0 — END-TO-END TESTING':^70}{RESET}")
-    print(f"{BOLD}{BLUE}{'='*70}{RESET}\n")
+    _OUT.write(f"\n{BOLD}{BLUE}{'='*70}{RESET}\n{BOLD}{BLUE}{'AUTOSIG v1.0 — END-TO-END TESTING':^70}{RESET}\n{BOLD}{BLUE}{'='*70}{RESET}\n\n")
     
     print_info("Testing each system layer in order...")
     print_info("If any layer fails, testing stops.\n")
@@ -528,38 +685,52 @@ def main():
     ]
     
     results = []
-    
-    for layer_name, test_func in layers:
-        try:
-            result = test_func()
-            results.append((layer_name, result))
-            
-            if not result:
-                print_fail(f"\n{layer_name} FAILED. Stopping tests.")
+    passed = 0
+    
+    # Layers still run (and print) in order and stop at the first failure;
+    # only the static file reads of layers 5-7 overlap with layers 1-4.
+    with ThreadPoolExecutor(max_workers=len(STATIC_CHECK_FILES)) as pool:
+        for path in STATIC_CHECK_FILES:
+            pool.submit(_read_text, path)
+        
+        for layer_name, test_func in layers:
+            try:
+                result = test_func()
+                results.append((layer_name, result))
+                
+                if result:
+                    passed += 1
+                else:
+                    print_fail(f"\n{layer_name} FAILED. Stopping tests.")
+                    break
+            except Exception as e:
+                print_fail(f"\n{layer_name} raised exception: {e}")
+                results.append((layer_name, False))
                 break
-        except Exception as e:
-            print_fail(f"\n{layer_name} raised exception: {e}")
-            results.append((layer_name, False))
-            break
+            finally:
+                flush_output()
     
     # Summary
     print_header("TEST SUMMARY")
     
-    passed = sum(1 for _, result in results if result)
     total = len(results)
     
-    for layer_name, result in results:
-        status = f"{GREEN}[PASS]{RESET}" if result else f"{RED}[FAIL]{RESET}"
-        print(f"  {status} {layer_name}")
+    _OUT.writelines(
+        f"  {_STATUS_PASS if result else _STATUS_FAIL} {layer_name}\n"
+        for layer_name, result in results
+    )
     
-    print(f"\n{BOLD}Results: {passed}/{total} layers passed{RESET}\n")
+    _OUT.write(f"\n{BOLD}Results: {passed}/{total} layers passed{RESET}\n\n")
     
     if passed == total:
         print_pass("All layers passed! System appears healthy.")
-        return 0
+        exit_code = 0
     else:
         print_fail("Some layers failed. Review errors above.")
-        return 1
+        exit_code = 1
+    
+    flush_output()
+    return exit_code
 
 
 if __name__ == "__main__":
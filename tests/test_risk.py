@@ -43,34 +43,42 @@ def create_test_signal(
     )
 
 
+@pytest.fixture(scope="module")
+def default_signal() -> ParsedSignal:
+    """Default debit spread signal; ParsedSignal is only read by RiskManager."""
+    return create_test_signal()
+
+
 class TestRiskManager:
-    def test_debit_spread_position_sizing(self):
-        manager = RiskManager(max_contracts_per_trade=10)
-        signal = create_test_signal(
-            strategy="CALL_DEBIT_SPREAD",
-            limit_max=2.0,
-            size_pct=0.02
-        )
+    @pytest.mark.parametrize("max_contracts, signal_kwargs, expected", [
+        pytest.param(
+            10,
+            dict(strategy="CALL_DEBIT_SPREAD", limit_max=2.0, size_pct=0.02),
+            10,
+            id="debit_spread",
+        ),
+        pytest.param(
+            20,
+            dict(strategy="CALL_CREDIT_SPREAD", limit_min=1.5, limit_max=1.7,
+                 size_pct=0.02, strikes=(100, 105)),
+            5,
+            id="credit_spread",
+        ),
+        pytest.param(
+            5,
+            dict(strategy="CALL_DEBIT_SPREAD", limit_max=1.0, size_pct=0.10),
+            5,
+            id="max_contracts_cap",
+        ),
+    ])
+    def test_position_sizing(self, max_contracts, signal_kwargs, expected):
+        manager = RiskManager(max_contracts_per_trade=max_contracts)
+        signal = create_test_signal(**signal_kwargs)
         
         num_contracts, reason = manager.calculate_position_size(signal, 100000)
         
         assert reason is None
-        assert num_contracts == 10
-    
-    def test_credit_spread_position_sizing(self):
-        manager = RiskManager(max_contracts_per_trade=20)
-        signal = create_test_signal(
-            strategy="CALL_CREDIT_SPREAD",
-            limit_min=1.5,
-            limit_max=1.7,
-            size_pct=0.02,
-            strikes=(100, 105)
-        )
-        
-        num_contracts, reason = manager.calculate_position_size(signal, 100000)
-        
-        assert reason is None
-        assert num_contracts > 0
+        assert num_contracts == expected
     
     def test_exit_returns_zero_contracts(self):
         manager = RiskManager()
@@ -81,34 +89,20 @@ class TestRiskManager:
         assert num_contracts == 0
         assert reason is None
     
-    def test_zero_equity_rejected(self):
+    def test_zero_equity_rejected(self, default_signal):
         manager = RiskManager()
-        signal = create_test_signal()
         
-        num_contracts, reason = manager.calculate_position_size(signal, 0)
+        num_contracts, reason = manager.calculate_position_size(default_signal, 0)
         
         assert num_contracts == 0
         assert reason is not None
         assert "zero or negative" in reason.lower()
     
-    def test_max_contracts_cap(self):
-        manager = RiskManager(max_contracts_per_trade=5)
-        signal = create_test_signal(
-            strategy="CALL_DEBIT_SPREAD",
-            limit_max=1.0,
-            size_pct=0.10
-        )
-        
-        num_contracts, reason = manager.calculate_position_size(signal, 100000)
-        
-        assert num_contracts == 5
-    
-    def test_max_open_positions_limit(self):
+    def test_max_open_positions_limit(self, default_signal):
         manager = RiskManager(max_open_positions=2)
         manager.open_positions_count = 2
         
-        signal = create_test_signal()
-        num_contracts, reason = manager.calculate_position_size(signal, 100000)
+        num_contracts, reason = manager.calculate_position_size(default_signal, 100000)
         
         assert num_contracts == 0
         assert reason is not None
@@ -5,19 +5,35 @@ TradeIntent represents a user's intent to trade, independent of any specific bro
 ExecutionResult represents the outcome of executing a TradeIntent.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from typing import Literal, Optional
-from pydantic import BaseModel, Field
-import uuid
+from pydantic import BaseModel, ConfigDict, Field
+import secrets
+
+
+def _utc_now() -> datetime:
+    """Current UTC time as a naive datetime, like the utcnow() stamps elsewhere."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 class OptionLeg(BaseModel):
     """Represents a single leg of an options trade."""
+    model_config = ConfigDict(frozen=True)
+    
     side: Literal["BUY", "SELL"]
     quantity: int = Field(gt=0, description="Number of contracts (always positive)")
     strike: float
     option_type: Literal["CALL", "PUT"] = "CALL"
     expiration: str = Field(description="Expiration date in YYYY-MM-DD format")
+    
+    @classmethod
+    def internal(cls, **kwargs) -> "OptionLeg":
+        """
+        Build a leg from values the caller has already normalised, without
+        validation. See ExecutionResult.internal.
+        """
+        return cls.model_construct(**kwargs)
 
 
 class TradeIntent(BaseModel):
@@ -26,9 +42,12 @@ class TradeIntent(BaseModel):
     
     This model captures everything needed to execute a trade across any broker.
     The execution layer maps this to broker-specific API calls.
+    Intents are immutable once built.
     """
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    model_config = ConfigDict(frozen=True)
+    
+    id: str = Field(default_factory=partial(secrets.token_hex, 16))
+    created_at: datetime = Field(default_factory=_utc_now)
     
     execution_mode: Literal["PAPER", "LIVE", "HISTORICAL"] = "PAPER"
     instrument_type: Literal["STOCK", "OPTION", "SPREAD"] = "STOCK"
@@ -83,3 +102,14 @@ class ExecutionResult(BaseModel):
     
     submitted_payload: Optional[dict] = Field(default=None, description="Raw payload sent to broker")
     raw_response: Optional[dict] = Field(default=None, description="Raw response from broker")
+    
+    @classmethod
+    def internal(cls, **kwargs) -> "ExecutionResult":
+        """
+        Build a result from trusted, already-typed values without validation.
+        
+        For results assembled by the executors themselves (rejections, simulated
+        fills). Anything mapped from a broker response must use the normal
+        constructor so it is validated.
+        """
+        return cls.model_construct(**kwargs)
@@ -9,16 +9,183 @@ Supports:
 """
 
 import os
+import ssl
+import json
+import time
 import logging
+from functools import lru_cache
 from typing import Optional, Literal
 import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
+from urllib3.util.retry import Retry
+from urllib3.util.ssl_ import create_urllib3_context
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional; it decodes large option chain payloads several times
+# faster than response.json(). Its JSONDecodeError subclasses json's.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 TRADIER_TOKEN = os.getenv("TRADIER_TOKEN")
 TRADIER_BASE_URL = os.getenv("TRADIER_BASE_URL", "https://sandbox.tradier.com")
 TRADIER_ACCOUNT_ID = os.getenv("TRADIER_ACCOUNT_ID")
 
+# (connect, read) timeouts in seconds
+REQUEST_TIMEOUT = (5, 30)
+
+# Cache lifetimes in seconds. Expirations and account lists change at most
+# daily; quotes are only cached when a client opts in with use_quote_cache.
+REFERENCE_CACHE_TTL = 3600
+QUOTE_CACHE_TTL = 1.0
+
+
+# 8-digit zero-padded OCC strike field, bound once
+_OCC_STRIKE_FMT = "{:08d}".format
+
+
+@lru_cache(maxsize=64)
+def _occ_root(underlying: str) -> str:
+    """Underlying symbol upper-cased and padded/truncated to 6 characters."""
+    return underlying.upper().ljust(6)[:6]
+
+
+@lru_cache(maxsize=256)
+def _occ_prefix(underlying: str, expiration: str, option_type: str) -> str:
+    """OCC SYMBOL + YYMMDD + C/P prefix shared by every strike of a chain."""
+    parts = expiration.split("-")
+    yy = parts[0][2:]
+    mm = parts[1]
+    dd = parts[2]
+    
+    return f"{_occ_root(underlying)}{yy}{mm}{dd}{option_type.upper()}"
+
+
+# Strikes in thousandths of a dollar, the unit of the OCC strike field.
+StrikeMilli = int
+
+
+def strike_to_milli(strike: float) -> StrikeMilli:
+    """
+    Convert a dollar strike to thousandths, rounding off float error.
+    
+    int(strike * 1000) truncates: 2.3 * 1000 is 2299.9999999999995.
+    """
+    return round(strike * 1000)
+
+
+def strike_from_milli(strike: StrikeMilli) -> float:
+    """Convert a strike in thousandths back to dollars."""
+    return strike / 1000
+
+
+@lru_cache(maxsize=8192)
+def _build_occ_symbol(underlying: str, expiration: str, option_type: str, strike: float) -> str:
+    """OCC symbol for one contract: prefix + strike*1000 (8 digits, zero-padded)."""
+    return _occ_prefix(underlying, expiration, option_type) + _OCC_STRIKE_FMT(strike_to_milli(strike))
+
+
+def _unwrap(response: dict, outer: str, inner: str):
+    """response[outer][inner], or None if either level is missing or "null"."""
+    container = response.get(outer)
+    if not isinstance(container, dict):
+        return None
+    return container.get(inner)
+
+
+def _as_list(value) -> list:
+    """Tradier sends a bare object for one item and "null"/omits it for none."""
+    if isinstance(value, list):
+        return value
+    return [value] if value and value != "null" else []
+
+
+# Characters of an error body kept on TradierError.response_text
+ERROR_EXCERPT_CHARS = 500
+
+
+def _error_excerpt(response: requests.Response) -> str:
+    """
+    The first ERROR_EXCERPT_CHARS characters of an error body.
+    
+    Only a bounded prefix is decoded: response.text decodes the whole body
+    (guessing the charset first when none is declared) on every access.
+    """
+    head = response.content[:ERROR_EXCERPT_CHARS * 4]
+    if not head:
+        return "No response body"
+    try:
+        text = head.decode(response.encoding or "utf-8", "replace")
+    except LookupError:
+        # Unknown charset in the Content-Type header
+        text = head.decode("utf-8", "replace")
+    return text[:ERROR_EXCERPT_CHARS]
+
+
+@lru_cache(maxsize=32)
+def _order_template(order_class: str, order_type: str, tif: str) -> dict:
+    """Fixed order form fields; copy with {**template, ...} before adding to it."""
+    return {"class": order_class, "type": order_type, "duration": tif}
+
+
+def _default_ca_bundle() -> str:
+    """CA bundle requests verifies against, honouring its env overrides."""
+    return (
+        os.environ.get("REQUESTS_CA_BUNDLE")
+        or os.environ.get("CURL_CA_BUNDLE")
+        or DEFAULT_CA_BUNDLE_PATH
+    )
+
+
+def _tls_context(ca_bundle: str) -> ssl.SSLContext:
+    """Verifying client context with ca_bundle (file or directory) loaded."""
+    ctx = create_urllib3_context()
+    ctx.options |= ssl.OP_NO_RENEGOTIATION
+    if os.path.isdir(ca_bundle):
+        ctx.load_verify_locations(capath=ca_bundle)
+    else:
+        ctx.load_verify_locations(cafile=ca_bundle)
+    return ctx
+
+
+class _TLSAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connections share one preloaded SSL context.
+    
+    By default every new connection builds a context and re-reads the CA
+    bundle. Here the bundle is read once; connections verifying against it
+    (verify=True or the same path) skip the per-connection load.
+    """
+    
+    def __init__(self, *args, ca_bundle: Optional[str] = None, **kwargs):
+        self._ca_bundle = ca_bundle or _default_ca_bundle()
+        self._ssl_context = _tls_context(self._ca_bundle)
+        super().__init__(*args, **kwargs)
+    
+    def _uses_shared_context(self, verify) -> bool:
+        return verify is True or verify == self._ca_bundle
+    
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(
+            request, verify, cert
+        )
+        if self._uses_shared_context(verify):
+            pool_kwargs.pop("ca_certs", None)
+            pool_kwargs.pop("ca_cert_dir", None)
+            pool_kwargs["ssl_context"] = self._ssl_context
+        return host_params, pool_kwargs
+    
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        if self._uses_shared_context(verify):
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
 
 class TradierError(Exception):
     """Custom exception for Tradier API errors."""
@@ -34,10 +201,20 @@ class TradierClient:
     Tradier API client for trading stocks and options.
     """
     
-    def __init__(self, token: str = None, base_url: str = None, account_id: str = None):
+    def __init__(
+        self,
+        token: str = None,
+        base_url: str = None,
+        account_id: str = None,
+        use_quote_cache: bool = False
+    ):
         self.token = token or TRADIER_TOKEN
         self.base_url = (base_url or TRADIER_BASE_URL).rstrip("/")
         self.account_id = account_id or TRADIER_ACCOUNT_ID
+        self.use_quote_cache = use_quote_cache
+        
+        # key -> (expires_at monotonic time, value)
+        self._cache: dict = {}
         
         if not self.token:
             raise TradierError("TRADIER_TOKEN is required")
@@ -46,6 +223,53 @@ class TradierClient:
             "Authorization": f"Bearer {self.token}",
             "Accept": "application/json"
         }
+        
+        # One pooled session per client so repeated calls reuse the
+        # TCP/TLS connection. Retry only covers idempotent methods (not
+        # order POSTs), never re-sends after a read timeout, and hands the
+        # final response back for normal status handling.
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        retry = Retry(
+            total=3,
+            read=False,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+        adapter = _TLSAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        
+        # Resolve proxy settings from the environment once; with trust_env
+        # on, requests rescans os.environ (and ~/.netrc) on every call.
+        # The CA bundle override is already applied by _TLSAdapter.
+        self._session.proxies.update(requests.utils.get_environ_proxies(self.base_url))
+        self._session.trust_env = False
+    
+    def _cached(self, key: tuple, ttl: float, fetch):
+        """Return a cached value for key, calling fetch() once it has expired."""
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] > now:
+            return hit[1]
+        value = fetch()
+        self._cache[key] = (now + ttl, value)
+        return value
+    
+    def clear_cache(self):
+        """Drop cached reference data and quotes."""
+        self._cache.clear()
+    
+    def close(self):
+        """Release pooled connections."""
+        self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
     
     def _request(self, method: str, endpoint: str, params: dict = None, data: dict = None) -> dict:
         """
@@ -66,44 +290,42 @@ class TradierClient:
         url = f"{self.base_url}{endpoint}"
         
         try:
-            response = requests.request(
+            response = self._session.request(
                 method=method,
                 url=url,
-                headers=self.headers,
                 params=params,
                 data=data,
-                timeout=30
+                timeout=REQUEST_TIMEOUT
             )
             
             if response.status_code >= 400:
-                excerpt = response.text[:500] if response.text else "No response body"
-                logger.error(f"Tradier API error: {response.status_code} - {excerpt}")
+                excerpt = _error_excerpt(response)
+                logger.error("Tradier API error: %s - %s", response.status_code, excerpt)
                 raise TradierError(
                     message=f"Tradier API error: {response.status_code}",
                     status_code=response.status_code,
                     response_text=excerpt
                 )
             
-            return response.json()
+            return _json_loads(response.content)
             
-        except requests.RequestException as e:
-            logger.error(f"Tradier request failed: {e}")
+        except (requests.RequestException, json.JSONDecodeError) as e:
+            logger.error("Tradier request failed: %s", e)
             raise TradierError(f"Request failed: {e}")
     
     def get_accounts(self) -> list:
         """
         Fetch all accounts associated with the token.
+        Cached for REFERENCE_CACHE_TTL seconds.
         
         Returns:
             List of account dictionaries
         """
-        response = self._request("GET", "/v1/user/profile")
-        profile = response.get("profile", {})
-        account_data = profile.get("account", [])
+        def fetch():
+            response = self._request("GET", "/v1/user/profile")
+            return _as_list(_unwrap(response, "profile", "account"))
         
-        if isinstance(account_data, dict):
-            return [account_data]
-        return account_data
+        return list(self._cached(("accounts",), REFERENCE_CACHE_TTL, fetch))
     
     def get_account_balance(self, account_id: str = None) -> dict:
         """
@@ -137,19 +359,12 @@ class TradierClient:
             raise TradierError("account_id is required")
         
         response = self._request("GET", f"/v1/accounts/{acct}/positions")
-        positions = response.get("positions", {})
-        
-        if positions == "null" or positions is None:
-            return []
-        
-        position_list = positions.get("position", [])
-        if isinstance(position_list, dict):
-            return [position_list]
-        return position_list or []
+        return _as_list(_unwrap(response, "positions", "position"))
     
     def quote(self, symbol: str) -> dict:
         """
         Fetch a quote for a symbol.
+        Cached for QUOTE_CACHE_TTL seconds if the client has use_quote_cache set.
         
         Args:
             symbol: Stock/ETF symbol (e.g., "SPY")
@@ -157,17 +372,20 @@ class TradierClient:
         Returns:
             Quote dictionary with last, bid, ask, etc.
         """
-        response = self._request("GET", "/v1/markets/quotes", params={"symbols": symbol})
-        quotes = response.get("quotes", {})
-        quote_data = quotes.get("quote", {})
-        
-        if isinstance(quote_data, list):
-            return quote_data[0] if quote_data else {}
-        return quote_data
+        def fetch():
+            response = self._request("GET", "/v1/markets/quotes", params={"symbols": symbol})
+            quotes = _as_list(_unwrap(response, "quotes", "quote"))
+            return quotes[0] if quotes else {}
+        
+        if not self.use_quote_cache:
+            return fetch()
+        quote_data = self._cached(("quote", symbol.upper()), QUOTE_CACHE_TTL, fetch)
+        return dict(quote_data) if isinstance(quote_data, dict) else quote_data
     
     def get_option_expirations(self, underlying: str) -> list:
         """
         Fetch available option expiration dates for an underlying.
+        Cached per underlying for REFERENCE_CACHE_TTL seconds.
         
         Args:
             underlying: Underlying symbol (e.g., "SPX", "SPY")
@@ -175,17 +393,15 @@ class TradierClient:
         Returns:
             List of expiration date strings (YYYY-MM-DD)
         """
-        response = self._request(
-            "GET", 
-            "/v1/markets/options/expirations",
-            params={"symbol": underlying}
-        )
-        expirations = response.get("expirations", {})
-        date_list = expirations.get("date", [])
+        def fetch():
+            response = self._request(
+                "GET", 
+                "/v1/markets/options/expirations",
+                params={"symbol": underlying}
+            )
+            return _as_list(_unwrap(response, "expirations", "date"))
         
-        if isinstance(date_list, str):
-            return [date_list]
-        return date_list or []
+        return list(self._cached(("expirations", underlying.upper()), REFERENCE_CACHE_TTL, fetch))
     
     def option_chain(self, underlying: str, expiration: str, option_type: str = None) -> list:
         """
@@ -207,12 +423,7 @@ class TradierClient:
             params["option_type"] = option_type
         
         response = self._request("GET", "/v1/markets/options/chains", params=params)
-        options = response.get("options", {})
-        option_list = options.get("option", [])
-        
-        if isinstance(option_list, dict):
-            return [option_list]
-        return option_list or []
+        return _as_list(_unwrap(response, "options", "option"))
     
     def place_stock_order(
         self,
@@ -248,18 +459,16 @@ class TradierClient:
             raise TradierError("symbol is required")
         
         order_data = {
-            "class": "equity",
+            **_order_template("equity", order_type, tif),
             "symbol": symbol,
             "side": side,
             "quantity": str(quantity),
-            "type": order_type,
-            "duration": tif
         }
         
-        if order_type in ["limit", "stop_limit"] and limit_price:
+        if order_type in ("limit", "stop_limit") and limit_price:
             order_data["price"] = str(limit_price)
         
-        if order_type in ["stop", "stop_limit"] and stop_price:
+        if order_type in ("stop", "stop_limit") and stop_price:
             order_data["stop"] = str(stop_price)
         
         response = self._request("POST", f"/v1/accounts/{acct}/orders", data=order_data)
@@ -276,7 +485,8 @@ class TradierClient:
         quantity: int = 1,
         order_type: Literal["market", "limit"] = "market",
         limit_price: Optional[float] = None,
-        tif: Literal["day", "gtc"] = "day"
+        tif: Literal["day", "gtc"] = "day",
+        option_symbol: Optional[str] = None
     ) -> dict:
         """
         Place a single-leg option order.
@@ -292,6 +502,8 @@ class TradierClient:
             order_type: Order type (market, limit)
             limit_price: Limit price (required for limit orders)
             tif: Time in force (day, gtc)
+            option_symbol: Prebuilt OCC symbol; when given, expiration,
+                strike and option_type are not needed
             
         Returns:
             Order response dictionary
@@ -299,19 +511,24 @@ class TradierClient:
         acct = account_id or self.account_id
         if not acct:
             raise TradierError("account_id is required")
-        if not all([underlying, expiration, strike]):
-            raise TradierError("underlying, expiration, and strike are required")
-        
-        occ_symbol = self._build_occ_symbol(underlying, expiration, option_type, strike)
+        if not underlying:
+            raise TradierError("underlying is required")
+        
+        if option_symbol:
+            occ_symbol = option_symbol
+        else:
+            if not expiration:
+                raise TradierError("expiration is required")
+            if strike is None:
+                raise TradierError("strike is required")
+            occ_symbol = self._build_occ_symbol(underlying, expiration, option_type, strike)
         
         order_data = {
-            "class": "option",
+            **_order_template("option", order_type, tif),
             "symbol": underlying,
             "option_symbol": occ_symbol,
             "side": side,
             "quantity": str(quantity),
-            "type": order_type,
-            "duration": tif
         }
         
         if order_type == "limit" and limit_price:
@@ -336,17 +553,7 @@ class TradierClient:
         Returns:
             OCC symbol string
         """
-        parts = expiration.split("-")
-        yy = parts[0][2:]
-        mm = parts[1]
-        dd = parts[2]
-        
-        strike_int = int(strike * 1000)
-        strike_str = f"{strike_int:08d}"
-        
-        symbol_padded = underlying.upper().ljust(6)[:6]
-        
-        return f"{symbol_padded}{yy}{mm}{dd}{option_type.upper()}{strike_str}"
+        return _build_occ_symbol(underlying, expiration, option_type, strike)
 
 
 def get_client(token: str = None, base_url: str = None, account_id: str = None) -> TradierClient:
@@ -4,13 +4,17 @@ Tests that we can fetch alerts from Whop and parse them.
 """
 
 import logging
+import re
 from datetime import datetime
 from typing import Dict, Any
 
-import config as whop_config
-
 logger = logging.getLogger(__name__)
 
+# A cookie value may not contain whitespace, quotes, commas, semicolons or
+# backslashes (RFC 6265); a value pasted with any of these can't
+# authenticate, so it is caught before starting a browser.
+_COOKIE_VALUE_RE = re.compile(r'[^\s",;\\]+')
+
 
 def _make_step(name: str, ok: bool, status: int = 0, summary: str = "", details: str = "") -> dict:
     """Create a standardized step result dict."""
@@ -35,6 +39,7 @@ def whop_health_check() -> Dict[str, Any]:
     
     Returns dict with service, success, timestamp, steps.
     """
+    import config as whop_config
     from scraper_whop import WhopScraperPlaywright, _get_whop_cookies
     from parser import parse_alert
     
@@ -76,6 +81,23 @@ def whop_health_check() -> Dict[str, Any]:
             "alerts_fetched": 0
         }
     
+    bad_cookies = [c["name"] for c in cookies if not _COOKIE_VALUE_RE.fullmatch(c["value"])]
+    if bad_cookies:
+        steps.append(_make_step(
+            "Config Check",
+            False,
+            0,
+            "Invalid Whop cookie value",
+            f"Check for quotes or whitespace in: {', '.join(bad_cookies)}"
+        ))
+        return {
+            "service": "whop",
+            "success": False,
+            "timestamp": datetime.utcnow().isoformat(),
+            "steps": steps,
+            "alerts_fetched": 0
+        }
+    
     cookie_names = [c["name"] for c in cookies]
     steps.append(_make_step(
         "Config Check",